@@ -1,4 +1,5 @@
 # RegisTree main window with security + tabs
+import os
 import sys
 import json
 import traceback
@@ -220,6 +221,9 @@ class MainWindow(QMainWindow):
 
 
 def main():
+    # Skip Qt's per-paint clipping of overlapping opaque sibling widgets;
+    # must be set before the QApplication is created
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
     app = QApplication(sys.argv)
 
     # 🔹 Global application icon uses ICON_PATH as well
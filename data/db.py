@@ -29,3 +29,9 @@ def init_db():
     # Ensure the directory containing registree.db exists
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     Base.metadata.create_all(engine)
+
+    # create_all() only adds indexes together with new tables, so create any
+    # indexes that were added to the models after an existing DB was made.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
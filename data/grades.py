@@ -0,0 +1,90 @@
+# data/grades.py
+"""
+Grade scale shared by the Students, Attendance and Settings tabs.
+"""
+from functools import lru_cache
+import re
+
+from sqlalchemy import Integer, case, cast, func
+
+# Canonical PreK–12 scale
+GRADE_SCALE = (
+    "PreK",
+    "K",
+    "1st",
+    "2nd",
+    "3rd",
+    "4th",
+    "5th",
+    "6th",
+    "7th",
+    "8th",
+    "9th",
+    "10th",
+    "11th",
+    "12th",
+)
+
+# Grade -> position in GRADE_SCALE
+GRADE_INDEX = {grade: i for i, grade in enumerate(GRADE_SCALE)}
+
+# Sort rank for grades that can't be matched to the scale (sorted last)
+UNKNOWN_GRADE_RANK = len(GRADE_SCALE) + 1
+
+# Leading number of a grade string, e.g. "5" in "5thgrade"
+GRADE_DIGIT_RE = re.compile(r"(\d+)")
+
+# Whole-string synonyms, checked before any other normalization
+_GRADE_ALIASES = {
+    "pre-k": "prek",
+    "pre k": "prek",
+    "prek": "prek",
+    "prekindergarten": "prek",
+    "k": "k",
+    "kindergarten": "k",
+}
+
+# Drops spaces and hyphens in one pass
+_GRADE_STRIP_CHARS = str.maketrans("", "", " -")
+
+
+@lru_cache(maxsize=128)
+def normalize_grade(s: str) -> str:
+    """Normalize a grade string for comparison."""
+    s = s.strip().lower()
+    alias = _GRADE_ALIASES.get(s)
+    if alias is not None:
+        return alias
+    # remove words like 'grade', then spaces and hyphens
+    return s.replace("grade", "").strip().translate(_GRADE_STRIP_CHARS)
+
+
+# Normalized grade text -> position in GRADE_SCALE
+NORMALIZED_GRADE_INDEX = {normalize_grade(g): i for i, g in enumerate(GRADE_SCALE)}
+
+
+def grade_rank_sql(grade_column):
+    """
+    SQL expression ranking grade_column for ORDER BY: its position in
+    GRADE_SCALE (PreK=0, K=1, 1st..12th=2..13) or UNKNOWN_GRADE_RANK.
+    Accepts the same spellings as normalize_grade plus a leading number
+    ("Pre-K", "Kindergarten", "Grade 5", "5", "5thgrade", ...).
+    """
+    text = func.lower(func.trim(grade_column))
+    key = func.replace(
+        func.replace(func.trim(func.replace(text, "grade", "")), " ", ""),
+        "-",
+        "",
+    )
+    number = cast(key, Integer)  # leading digits; 0 if none
+    prek = GRADE_INDEX["PreK"]
+    kinder = GRADE_INDEX["K"]
+    return case(
+        (text.in_([a for a, n in _GRADE_ALIASES.items() if n == "prek"]), prek),
+        (text.in_([a for a, n in _GRADE_ALIASES.items() if n == "k"]), kinder),
+        (key == "prek", prek),
+        (key == "k", kinder),
+        # "1st".."12th" sit right after PreK and K
+        (number.between(1, 12), number + kinder),
+        else_=UNKNOWN_GRADE_RANK,
+    )
@@ -7,8 +7,10 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     UniqueConstraint,
+    Index,
     Boolean,
     Text,
+    insert,
 )
 from datetime import date, datetime
 import json
@@ -53,6 +55,13 @@ class Student(Base):
         cascade="all, delete-orphan",
     )
 
+    # Status filters (Students tab, dashboard counts, promotion) and
+    # name-ordered rosters (class enrollment pickers, calendar lists)
+    __table_args__ = (
+        Index("ix_student_status", "status"),
+        Index("ix_student_last_first", "last_name", "first_name"),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<Student id={self.id} "
@@ -159,6 +168,20 @@ class Attendance(Base):
     student = relationship("Student")
     clazz = relationship("Class")
 
+    # Date-range exports/summaries scan by date and group by class/status;
+    # the extra columns let SQLite answer those from the index alone.
+    __table_args__ = (
+        Index(
+            "ix_attendance_date_class",
+            "date",
+            "class_id",
+            "status",
+            "student_id",
+        ),
+        # Per-student history in the profile dialog (student + date range)
+        Index("ix_attendance_student_date", "student_id", "date"),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<Attendance id={self.id} "
@@ -181,6 +204,19 @@ class AdminUser(Base):
         return f"<AdminUser id={self.id} username={self.username}>"
 
 
+def get_admin(session):
+    """
+    Return the single AdminUser row, cached on the session after the first
+    lookup. The session is shared across tabs, so a password change made
+    anywhere updates this same instance in place.
+    """
+    admin = session.info.get("admin_user")
+    if admin is None:
+        admin = session.query(AdminUser).first()
+        session.info["admin_user"] = admin
+    return admin
+
+
 class Settings(Base):
     __tablename__ = "settings"
 
@@ -218,6 +254,31 @@ class Settings(Base):
     # If true, the Teacher Tracker tab allows check-in/check-out times
     teacher_check_in_out_enabled = Column(Boolean, nullable=False, default=False)
 
+    @property
+    def attendance_statuses(self):
+        """
+        attendance_statuses_json parsed into a list of strings, or None if it
+        is empty or malformed. The parse is memoized per JSON string, so
+        assigning a new attendance_statuses_json invalidates it automatically.
+        """
+        raw = self.attendance_statuses_json
+        cached = getattr(self, "_statuses_cache", None)
+        if cached is None or cached[0] != raw:
+            try:
+                statuses = json.loads(raw) if raw else None
+            except ValueError:
+                statuses = None
+            if not (
+                isinstance(statuses, list)
+                and statuses
+                and all(isinstance(x, str) for x in statuses)
+            ):
+                statuses = None
+            cached = self._statuses_cache = (raw, statuses)
+
+        # Copy so callers can't modify the cached list
+        return list(cached[1]) if cached[1] is not None else None
+
     def __repr__(self) -> str:
         return f"<Settings id={self.id} school_name={self.school_name!r}>"
 
@@ -351,6 +412,8 @@ class TeacherAttendance(Base):
 
     __table_args__ = (
         UniqueConstraint("teacher_id", "date", name="uq_teacher_date"),
+        # Date-range scans (monthly summary, logs) by date then teacher/status
+        Index("ix_teacher_attendance_date", "date", "teacher_id", "status"),
     )
 
     def __repr__(self) -> str:
@@ -415,13 +478,47 @@ def add_audit_log(
     - before: dict snapshot of old values (or None)
     - after:  dict snapshot of new values (or None)
     """
-    log = AuditLog(
-        actor=actor or "System",
-        action=action,
-        entity=entity,
-        entity_id=entity_id,
-        timestamp=datetime.utcnow(),
-        before_json=json.dumps(before) if before is not None else None,
-        after_json=json.dumps(after) if after is not None else None,
+    session.add(
+        AuditLog(**_audit_log_values(actor, action, entity, entity_id, before, after))
+    )
+
+
+def add_audit_logs(session, entries):
+    """
+    Bulk version of add_audit_log: insert many AuditLog rows with a single
+    executemany INSERT instead of one ORM object per row.
+
+    - entries: iterable of dicts with add_audit_log's keyword arguments
+               (actor, action, entity, entity_id, and optionally before/after)
+    """
+    rows = [_audit_log_values(**entry) for entry in entries]
+    if rows:
+        session.execute(insert(AuditLog), rows)
+
+
+def audit_diff(before, after):
+    """
+    Trim a pair of update snapshots to the fields that changed.
+
+    Returns (before, after) dicts holding only the keys whose values differ,
+    so an "update" AuditLog row records the change rather than two full
+    copies of the record.
+    """
+    changed = [key for key, value in after.items() if before.get(key) != value]
+    return (
+        {key: before.get(key) for key in changed},
+        {key: after[key] for key in changed},
     )
-    session.add(log)
+
+
+def _audit_log_values(actor, action, entity, entity_id, before=None, after=None):
+    """Column values for one AuditLog row (see add_audit_log)."""
+    return {
+        "actor": actor or "System",
+        "action": action,
+        "entity": entity,
+        "entity_id": entity_id,
+        "timestamp": datetime.utcnow(),
+        "before_json": json.dumps(before) if before is not None else None,
+        "after_json": json.dumps(after) if after is not None else None,
+    }
@@ -1,19 +1,72 @@
+from functools import lru_cache
+import hmac
+import time
+
 import bcrypt
 
+# bcrypt cost bounds: never weaker than MIN_ROUNDS (bcrypt's own default
+# cost), never slower than MAX_ROUNDS. Calibration only ever raises the cost.
+MIN_ROUNDS = 12
+MAX_ROUNDS = 15
+
+# Aim for roughly this long per hash/verify on the current machine
+TARGET_HASH_MS = 250
+
+
+@lru_cache(maxsize=None)
+def calibrate_rounds(target_ms: int = TARGET_HASH_MS) -> int:
+    """
+    Pick the bcrypt cost whose hash takes about target_ms on this machine.
+
+    Times a single hash at MIN_ROUNDS (each extra round doubles the work)
+    and is measured once per process.
+    """
+    start = time.perf_counter()
+    bcrypt.hashpw(b"registree-calibration", bcrypt.gensalt(MIN_ROUNDS))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    rounds = MIN_ROUNDS
+    while rounds < MAX_ROUNDS and elapsed_ms * 2 <= target_ms:
+        rounds += 1
+        elapsed_ms *= 2
+    return rounds
+
 def hash_password(password: str) -> str:
     """
     Hash a plaintext password using bcrypt.
     Returns a UTF-8 string representation of the hash.
     """
     password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(calibrate_rounds())
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
 def verify_password(password: str, stored_hash: str) -> bool:
     """
     Check a plaintext password against a stored bcrypt hash.
+    The final comparison is constant-time.
     """
     password_bytes = password.encode("utf-8")
     hash_bytes = stored_hash.encode("utf-8")
-    return bcrypt.checkpw(password_bytes, hash_bytes)
+    candidate = bcrypt.hashpw(password_bytes, hash_bytes)
+    return hmac.compare_digest(candidate, hash_bytes)
+
+@lru_cache(maxsize=None)
+def dummy_hash() -> str:
+    """
+    A throwaway hash at the calibrated cost. Verifying against it when no
+    admin exists makes that path take as long as a real login attempt.
+    StartupDialog builds it on the thread pool before the first login.
+    """
+    return hash_password("x" * 16)
+
+def needs_rehash(stored_hash: str) -> bool:
+    """
+    True if the stored bcrypt hash uses a lower cost than this machine's
+    calibrated target (the cost is encoded in the hash: $2b$<cost>$...).
+    """
+    try:
+        rounds = int(stored_hash.split("$")[2])
+    except (IndexError, ValueError):
+        return False
+    return rounds < calibrate_rounds()
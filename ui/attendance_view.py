@@ -17,6 +17,9 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import QDate, Qt
 from PySide6.QtGui import QBrush, QColor
+from sqlalchemy import func
+
+from data.grades import grade_rank_sql
 from data.models import (
     Class,
     Student,
@@ -48,20 +51,11 @@ class AttendanceView(QWidget):
         
         # Determine which statuses to use
         self.status_options = list(self.DEFAULT_STATUS_OPTIONS)
-        if self.settings is not None and getattr(
-            self.settings, "attendance_statuses_json", None
-        ):
-            try:
-                data = json.loads(self.settings.attendance_statuses_json)
-                if (
-                    isinstance(data, list)
-                    and data
-                    and all(isinstance(x, str) for x in data)
-                ):
-                    self.status_options = data
-            except Exception:
-                # Fall back to defaults on any parsing error
-                self.status_options = list(self.DEFAULT_STATUS_OPTIONS)
+        if self.settings is not None:
+            # Parsed once per JSON value and cached on the Settings row
+            statuses = self.settings.attendance_statuses
+            if statuses:
+                self.status_options = statuses
 
         # Track dirty (unsaved) rows and a load guard
         self._dirty_rows = set()
@@ -377,83 +371,18 @@ class AttendanceView(QWidget):
             QMessageBox.information(self, "Attendance", "No students enrolled in this class.")
             return
         
-        # Order of students in roster
+        # Order of students in roster: grade (PreK→12), then last name, then ID
         students = (
             self.session.query(Student)
             .filter(Student.id.in_(student_ids))
+            .order_by(
+                grade_rank_sql(Student.grade_level),
+                func.lower(Student.last_name),
+                Student.id,
+            )
             .all()
         )
 
-        # --- Sort students: grade (PreK→12), then last name, then ID ---
-
-        GRADE_ORDER = [
-            "PreK",
-            "K",
-            "1st",
-            "2nd",
-            "3rd",
-            "4th",
-            "5th",
-            "6th",
-            "7th",
-            "8th",
-            "9th",
-            "10th",
-            "11th",
-            "12th",
-        ]
-
-        def normalize_grade_text(s: str) -> str:
-            s = s.strip().lower()
-            if s in ("pre-k", "pre k", "prek", "prekindergarten"):
-                return "prek"
-            if s in ("k", "kindergarten"):
-                return "k"
-            s = s.replace("grade", "").strip()
-            s = s.replace(" ", "").replace("-", "")
-            return s
-
-        grade_rank_map = {}
-        for idx, g in enumerate(GRADE_ORDER):
-            grade_rank_map[normalize_grade_text(g)] = idx
-
-        def grade_rank(grade_level: str) -> int:
-            if not grade_level:
-                return len(GRADE_ORDER) + 1  # unknown grades at bottom
-
-            s = normalize_grade_text(grade_level)
-            if s in grade_rank_map:
-                return grade_rank_map[s]
-
-            import re
-            m = re.match(r"(\d+)", s)
-            if m:
-                n = int(m.group(1))
-                if 1 <= n <= 12:
-                    if n == 1:
-                        key = "1st"
-                    elif n == 2:
-                        key = "2nd"
-                    elif n == 3:
-                        key = "3rd"
-                    else:
-                        key = f"{n}th"
-                    return grade_rank_map.get(
-                        normalize_grade_text(key),
-                        len(GRADE_ORDER) + 1,
-                    )
-
-            return len(GRADE_ORDER) + 1
-
-        def student_sort_key(s):
-            return (
-                grade_rank(s.grade_level or ""),
-                (s.last_name or "").lower(),
-                s.id or 0,  # tie-breaker
-            )
-
-        students.sort(key=student_sort_key)
-
         # Preload any existing attendance records for this date & class
         existing = {
             (a.student_id): a
@@ -0,0 +1,38 @@
+# ui/background_task.py
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class BackgroundTaskSignals(QObject):
+    """Signals for BackgroundTask (QRunnable itself cannot emit signals)."""
+
+    # (task, result of fn())
+    finished = Signal(object, object)
+    # (task, error message)
+    failed = Signal(object, str)
+
+
+class BackgroundTask(QRunnable):
+    """
+    Runs fn() on a QThreadPool worker and reports back through
+    self.signals: `finished` with fn()'s return value, or `failed` with the
+    exception text. Connect the signals to methods of a GUI-thread QObject
+    so the slots run on the GUI thread.
+
+    fn must not touch the shared SQLAlchemy session or any widgets.
+    """
+
+    def __init__(self, fn):
+        super().__init__()
+        # Ownership stays on the Python side until the task reports back
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.signals = BackgroundTaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(self, str(e))
+            return
+        self.signals.finished.emit(self, result)
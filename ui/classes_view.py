@@ -442,11 +442,7 @@ class ClassesView(QWidget):
 
         class_id = int(id_item.text())
 
-        clazz = (
-            self.session.query(Class)
-            .filter(Class.id == class_id)
-            .first()
-        )
+        clazz = self.session.get(Class, class_id)
         if clazz is None:
             QMessageBox.warning(self, "Edit Class", "Class not found in database.")
             return
@@ -1,11 +1,22 @@
+from collections import Counter
+from contextlib import closing, contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from pathlib import Path
 import csv
+import ctypes
 import json
 import shutil
+import sqlite3
 import os
 import sys
 import subprocess
+import uuid
+
+try:
+    import fcntl  # POSIX only; used for reflink copies on Linux
+except ImportError:
+    fcntl = None
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -19,28 +30,279 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QInputDialog,
 )
-from PySide6.QtCore import QDate
+from PySide6.QtCore import QDate, QThreadPool
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
+from sqlalchemy import func, select
 
 from data.models import (
     Student,
     Class,
     Enrollment,
     Attendance,
-    AdminUser,
     Teacher,
     TeacherClassLink,
     CalendarEvent,
     TeacherAttendance,
+    get_admin,
 )
 from data.security import hash_password, verify_password
 from ui.auth_dialogs import ChangePasswordDialog
+from ui.background_task import BackgroundTask
 from data.paths import DB_PATH, EXPORTS_DIR, PHOTOS_DIR
 
 # For backward compatibility with older references in this file
 DB_FILE = DB_PATH
 
+# Write buffer for the larger CSV reports (fewer write() syscalls per export)
+CSV_BUFFER_SIZE = 1 << 20
+
+# Rows fetched per batch when streaming column-only queries into CSV files
+STREAM_BATCH_SIZE = 1000
+# ioctl request number for a copy-on-write clone (FICLONE, linux/fs.h)
+LINUX_FICLONE = 0x40049409
+# Pages copied per step by the SQLite online backup API
+SQLITE_BACKUP_PAGES = 1024
+
+
+def _status_label(status: str | None) -> str:
+    """Attendance status as shown in summaries (blank statuses grouped)."""
+    return (status or "").strip() or "(blank)"
+
+
+def _iso(value) -> str:
+    """ISO string for an optional date/datetime/time ('' when missing)."""
+    return value.isoformat() if value else ""
+
+
+# Opens a folder in the system file explorer (platform chosen once at import)
+if sys.platform.startswith("win"):
+    # Windows
+    _open_in_file_manager = os.startfile  # type: ignore[attr-defined]
+elif sys.platform == "darwin":
+    # macOS
+    def _open_in_file_manager(path: str):
+        subprocess.Popen(["open", path])
+else:
+    # Linux / other
+    def _open_in_file_manager(path: str):
+        subprocess.Popen(["xdg-open", path])
+
+
+def _load_macos_clonefile():
+    """Return libc's clonefile() on macOS, or None where unavailable."""
+    if sys.platform != "darwin":
+        return None
+    try:
+        clonefile = ctypes.CDLL("libc.dylib", use_errno=True).clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+
+_macos_clonefile = _load_macos_clonefile()
+
+
+def _clone_or_copy(src: str, dst: Path):
+    """
+    Copy one file, preferring a copy-on-write clone (reflink) so the data
+    is shared instead of duplicated: FICLONE on Linux (Btrfs, XFS, ...) and
+    clonefile() on macOS (APFS). Falls back to shutil.copy2 when the
+    filesystem cannot clone.
+    """
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), LINUX_FICLONE, fsrc.fileno())
+        except OSError:
+            pass  # not supported here (EOPNOTSUPP, EXDEV, ...)
+        else:
+            shutil.copystat(src, dst)
+            return
+    elif _macos_clonefile is not None:
+        # clonefile() keeps metadata but refuses to overwrite an existing file
+        if _macos_clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            return
+
+    shutil.copy2(src, dst)
+
+
+def _copy_tree_parallel(src_dir: Path, dest_dir: Path, max_workers: int = 8) -> int:
+    """
+    Copy every file under src_dir into dest_dir (same relative layout).
+
+    The tree is walked with os.scandir and the per-file copies (reflinks
+    where supported, see _clone_or_copy) run on a thread pool so many small
+    photo copies overlap their disk I/O.
+    Dangling symlinks are skipped. Returns the number of files copied.
+    """
+    pairs = []
+    pending = [(src_dir, dest_dir)]
+    while pending:
+        src, dest = pending.pop()
+        dest.mkdir(parents=True, exist_ok=True)
+        with os.scandir(src) as entries:
+            for entry in entries:
+                target = dest / entry.name
+                if entry.is_dir():
+                    pending.append((Path(entry.path), target))
+                elif entry.is_file():
+                    pairs.append((entry.path, target))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Consuming the results re-raises the first copy error, if any
+        list(pool.map(lambda pair: _clone_or_copy(*pair), pairs))
+    return len(pairs)
+
+
+def _draw_text_lines(c, lines, x, y, page_height, leading=16):
+    """
+    Draw lines in Helvetica 11 starting at (x, y) using one text object per
+    page instead of a drawString call per line. Starts a new page when the
+    text reaches the bottom margin. Returns the y position after the last line.
+    """
+    text = c.beginText(x, y)
+    text.setFont("Helvetica", 11, leading=leading)
+    for line in lines:
+        text.textLine(line)
+        if text.getY() < 72:
+            c.drawText(text)
+            c.showPage()
+            text = c.beginText(x, page_height - 72)
+            text.setFont("Helvetica", 11, leading=leading)
+    c.drawText(text)
+    return text.getY()
+
+
+@contextmanager
+def _atomic_output(file_path: Path):
+    """
+    Yield a temporary path next to file_path. When the block succeeds the
+    temp file atomically replaces file_path (os.replace); on error it is
+    removed, so a failed export never leaves a truncated file behind.
+    """
+    # Unique name: two exports of the same file may be in flight at once
+    tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, file_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+@contextmanager
+def _atomic_open(file_path: Path, mode: str = "w", **kwargs):
+    """open() wrapper for export files; see _atomic_output."""
+    with _atomic_output(file_path) as tmp_path:
+        with tmp_path.open(mode, **kwargs) as f:
+            yield f
+
+
+def _write_monthly_summary_pdf(
+    file_path: Path,
+    month_start: date,
+    month_end: date,
+    status_counts,
+    class_counts,
+    teacher_status_counts,
+) -> str:
+    """
+    Render the monthly summary PDF from precomputed counts.
+    Safe to run on a worker thread (no database access).
+    """
+    with _atomic_output(file_path) as tmp_path:
+        c = canvas.Canvas(str(tmp_path), pagesize=letter)
+        width, height = letter
+        y = height - 72
+
+        c.setFont("Helvetica-Bold", 16)
+        c.drawString(
+            72,
+            y,
+            f"Monthly Attendance Summary - {month_start.year}-{month_start.month:02d}",
+        )
+        y -= 30
+
+        c.setFont("Helvetica", 11)
+        c.drawString(72, y, f"Date range: {month_start} to {month_end}")
+        y -= 24
+
+        # Student status totals
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(72, y, "Student Attendance: Unique totals by Status")
+        y -= 18
+        if status_counts:
+            lines = [f"{status}: {count}" for status, count in status_counts.items()]
+        else:
+            lines = ["No student attendance records for this month."]
+        y = _draw_text_lines(c, lines, 90, y, height)
+
+        y -= 16
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(72, y, "Student Attendance: Total rows by Class")
+        y -= 18
+        if class_counts:
+            lines = [f"{cname}: {count}" for cname, count in class_counts.items()]
+        else:
+            lines = ["No class attendance records for this month."]
+        y = _draw_text_lines(c, lines, 90, y, height)
+
+        # Teacher status totals
+        y -= 20
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(72, y, "Teacher Attendance: Unique totals by Status")
+        y -= 18
+        if teacher_status_counts:
+            lines = [f"{status}: {count}" for status, count in teacher_status_counts.items()]
+        else:
+            lines = ["No teacher attendance records for this month."]
+        y = _draw_text_lines(c, lines, 90, y, height)
+
+        c.showPage()
+        c.save()
+
+    return f"Monthly summary PDF created:\n{file_path}"
+
+
+def _backup_sqlite_db(src_path: Path, dest_path: Path):
+    """
+    Copy a SQLite database with the online backup API. Unlike a plain file
+    copy this yields a consistent snapshot even if another connection is
+    writing while the backup runs.
+
+    A raw in-kernel copy (os.sendfile) would be faster for large files, but
+    it can capture a half-written database, so it is only used for photos
+    (shutil.copy2 already takes the sendfile/fcopyfile path there).
+    """
+    with closing(sqlite3.connect(src_path)) as src, closing(
+        sqlite3.connect(dest_path)
+    ) as dst:
+        src.backup(dst, pages=SQLITE_BACKUP_PAGES)
+
+
+def _run_full_backup(backup_dir: Path) -> str:
+    """
+    Copy the database file and the photos/ directory into backup_dir.
+    Returns the summary message shown to the user.
+    """
+    # Copy database
+    if DB_FILE.exists():
+        _backup_sqlite_db(DB_FILE, backup_dir / DB_FILE.name)
+        db_msg = f"Database copied as {DB_FILE.name}"
+    else:
+        db_msg = "Database file NOT FOUND."
+
+    # Copy photos directory (if present)
+    if PHOTOS_DIR.exists() and PHOTOS_DIR.is_dir():
+        _copy_tree_parallel(PHOTOS_DIR, backup_dir / PHOTOS_DIR.name)
+        photos_msg = f"Photos folder copied ({PHOTOS_DIR})"
+    else:
+        photos_msg = "Photos folder not found; skipped."
+
+    return f"Full backup created at:\n{backup_dir}\n\n{db_msg}\n{photos_msg}"
+
 
 class ExportsView(QWidget):
     """
@@ -58,6 +320,14 @@ class ExportsView(QWidget):
         self.session = session
         self.settings = settings
 
+        # Monthly summary aggregates, keyed by (month_start, month_end).
+        # Each entry is (fingerprint, counts); see _monthly_summary_counts().
+        self._monthly_summary_cache = {}
+        # Export folders already created by _ensure_dir
+        self._created_dirs = set()
+        # BackgroundTask -> (title, button, error prefix) while running
+        self._background_tasks = {}
+
         main_layout = QVBoxLayout()
 
         # --------------------------------------------------------------
@@ -291,26 +561,46 @@ class ExportsView(QWidget):
         1) settings.export_base_dir (if set)
         2) EXPORTS_DIR from data.paths (DATA_ROOT/exports)
         """
+        return self._ensure_dir(self._export_base_path())
+
+    def _export_base_path(self) -> Path:
+        """Base exports folder path (see _get_exports_dir); not created here."""
         if self.settings is not None and getattr(
             self.settings, "export_base_dir", None
         ):
-            base = Path(self.settings.export_base_dir)
-        else:
-            base = EXPORTS_DIR
-
-        base.mkdir(parents=True, exist_ok=True)
-        return base
+            return Path(self.settings.export_base_dir)
+        return EXPORTS_DIR
 
     def _subdir(self, *parts: str) -> Path:
         """
         Create (if needed) and return a subdirectory inside the base exports dir.
         Example: _subdir("rosters", "students") -> <exports>/rosters/students/
         """
-        d = self._get_exports_dir()
-        for p in parts:
-            d = d / p
-        d.mkdir(parents=True, exist_ok=True)
-        return d
+        # mkdir(parents=True) in _ensure_dir also creates the base folder
+        return self._ensure_dir(self._export_base_path().joinpath(*parts))
+
+    def _ensure_dir(self, path: Path) -> Path:
+        """
+        mkdir -p `path`, skipping the mkdir chain for folders this view has
+        already created. Entries are full paths, so changing export_base_dir
+        simply misses the cache; the is_dir() check recreates folders that
+        were removed while RegisTree was running.
+        """
+        if path not in self._created_dirs or not path.is_dir():
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+        return path
+
+    def _stream_rows(self, stmt):
+        """
+        Execute a Core select with a streaming (server-side) cursor, fetching
+        STREAM_BATCH_SIZE rows at a time so large exports use flat memory.
+        """
+        return self.session.execute(
+            stmt.execution_options(
+                stream_results=True, yield_per=STREAM_BATCH_SIZE
+            )
+        )
 
     def _get_date_dir(self, att_date: date) -> Path:
         """
@@ -348,7 +638,7 @@ class ExportsView(QWidget):
             .all()
         )
 
-        with file_path.open("w", newline="", encoding="utf-8") as f:
+        with _atomic_open(file_path, newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(
                 [
@@ -374,7 +664,7 @@ class ExportsView(QWidget):
                         s.id,
                         s.first_name or "",
                         s.last_name or "",
-                        s.dob.isoformat() if s.dob else "",
+                        _iso(s.dob),
                         s.grade_level or "",
                         s.contact_email or "",
                         s.guardian_name or "",
@@ -430,7 +720,7 @@ class ExportsView(QWidget):
                 }
             )
 
-        with file_path.open("w", encoding="utf-8") as f:
+        with _atomic_open(file_path, encoding="utf-8") as f:
             json.dump(data, f, indent=2)
 
         return len(students)
@@ -459,7 +749,7 @@ class ExportsView(QWidget):
             .all()
         )
 
-        with file_path.open("w", newline="", encoding="utf-8") as f:
+        with _atomic_open(file_path, newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(
                 [
@@ -505,7 +795,7 @@ class ExportsView(QWidget):
 
         links = self.session.query(TeacherClassLink).all()
 
-        with file_path.open("w", newline="", encoding="utf-8") as f:
+        with _atomic_open(file_path, newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(
                 [
@@ -552,7 +842,7 @@ class ExportsView(QWidget):
 
         classes = self.session.query(Class).order_by(Class.name).all()
 
-        with file_path.open("w", newline="", encoding="utf-8") as f:
+        with _atomic_open(file_path, newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             # We export a single 'teachers' column that lists linked teachers
             # as "id:First Last; id:First Last".
@@ -607,7 +897,7 @@ class ExportsView(QWidget):
             .all()
         )
 
-        with file_path.open("w", newline="", encoding="utf-8") as f:
+        with _atomic_open(file_path, newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(
                 [
@@ -633,8 +923,8 @@ class ExportsView(QWidget):
                         c.id,
                         c.name or "",
                         c.term or "",
-                        e.start_date.isoformat() if e.start_date else "",
-                        e.end_date.isoformat() if e.end_date else "",
+                        _iso(e.start_date),
+                        _iso(e.end_date),
                     ]
                 )
 
@@ -662,7 +952,7 @@ class ExportsView(QWidget):
             .all()
         )
 
-        with file_path.open("w", newline="", encoding="utf-8") as f:
+        with _atomic_open(file_path, newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(
                 [
@@ -681,8 +971,8 @@ class ExportsView(QWidget):
                         ev.id,
                         ev.title or "",
                         ev.event_type or "",
-                        ev.start_date.isoformat() if ev.start_date else "",
-                        ev.end_date.isoformat() if ev.end_date else "",
+                        _iso(ev.start_date),
+                        _iso(ev.end_date),
                         (ev.notes or "").replace("\n", " "),
                     ]
                 )
@@ -700,16 +990,61 @@ class ExportsView(QWidget):
         """Helper: write student attendance_DATE.csv into out_dir, return count."""
         file_path = out_dir / f"attendance_{att_date.isoformat()}.csv"
 
-        records = (
-            self.session.query(Attendance, Student, Class)
+        stmt = (
+            select(
+                Attendance.id,
+                Student.id,
+                Student.first_name,
+                Student.last_name,
+                Class.id,
+                Class.name,
+                Class.term,
+                Attendance.date,
+                Attendance.status,
+                Attendance.marked_by,
+                Attendance.timestamp,
+            )
             .join(Student, Attendance.student_id == Student.id)
             .join(Class, Attendance.class_id == Class.id)
-            .filter(Attendance.date == att_date)
+            .where(Attendance.date == att_date)
             .order_by(Class.name, Student.last_name, Student.first_name)
-            .all()
         )
+        result = self._stream_rows(stmt)
+        count = 0
+
+        def rows():
+            nonlocal count
+            for (
+                att_id,
+                student_id,
+                first_name,
+                last_name,
+                class_id,
+                class_name,
+                class_term,
+                att_day,
+                status,
+                marked_by,
+                timestamp,
+            ) in result:
+                count += 1
+                yield (
+                    att_id,
+                    student_id,
+                    first_name or "",
+                    last_name or "",
+                    class_id,
+                    class_name or "",
+                    class_term or "",
+                    _iso(att_day),
+                    status or "",
+                    marked_by or "",
+                    _iso(timestamp),
+                )
 
-        with file_path.open("w", newline="", encoding="utf-8") as f:
+        with _atomic_open(
+            file_path, newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE
+        ) as f:
             writer = csv.writer(f)
             writer.writerow(
                 [
@@ -726,25 +1061,9 @@ class ExportsView(QWidget):
                     "timestamp",
                 ]
             )
+            writer.writerows(rows())
 
-            for a, s, c in records:
-                writer.writerow(
-                    [
-                        a.id,
-                        s.id,
-                        s.first_name or "",
-                        s.last_name or "",
-                        c.id,
-                        c.name or "",
-                        c.term or "",
-                        a.date.isoformat() if a.date else "",
-                        a.status or "",
-                        a.marked_by or "",
-                        a.timestamp.isoformat() if a.timestamp else "",
-                    ]
-                )
-
-        return len(records)
+        return count
 
     # ------------------------------------------------------------------
     # TEACHER ATTENDANCE: CSV (single date, helper for bundle)
@@ -755,15 +1074,70 @@ class ExportsView(QWidget):
         """
         file_path = out_dir / f"teacher_attendance_{att_date.isoformat()}.csv"
 
-        records = (
-            self.session.query(TeacherAttendance, Teacher)
-            .join(Teacher, TeacherAttendance.teacher_id == Teacher.id)
-            .filter(TeacherAttendance.date == att_date)
+        stmt = (
+            self._teacher_attendance_select()
+            .where(TeacherAttendance.date == att_date)
             .order_by(Teacher.last_name, Teacher.first_name, TeacherAttendance.id)
-            .all()
         )
+        return self._write_teacher_attendance_csv(file_path, stmt)
+
+    def _teacher_attendance_select(self):
+        """
+        Column-only SELECT for teacher attendance CSV rows (joined with Teacher).
+        Callers add their own WHERE / ORDER BY.
+        """
+        return select(
+            TeacherAttendance.id,
+            Teacher.id,
+            Teacher.first_name,
+            Teacher.last_name,
+            TeacherAttendance.date,
+            TeacherAttendance.status,
+            TeacherAttendance.check_in_time,
+            TeacherAttendance.check_out_time,
+            TeacherAttendance.marked_by,
+            TeacherAttendance.timestamp,
+        ).join(Teacher, TeacherAttendance.teacher_id == Teacher.id)
+
+    def _write_teacher_attendance_csv(self, file_path: Path, stmt) -> int:
+        """
+        Stream the rows of a _teacher_attendance_select() statement into a CSV
+        file (no ORM objects are built). Returns the number of rows written.
+        """
+        result = self._stream_rows(stmt)
+        count = 0
+
+        def rows():
+            nonlocal count
+            for (
+                ta_id,
+                teacher_id,
+                first_name,
+                last_name,
+                att_day,
+                status,
+                check_in,
+                check_out,
+                marked_by,
+                timestamp,
+            ) in result:
+                count += 1
+                yield (
+                    ta_id,
+                    teacher_id,
+                    first_name or "",
+                    last_name or "",
+                    _iso(att_day),
+                    status or "",
+                    _iso(check_in),
+                    _iso(check_out),
+                    marked_by or "",
+                    _iso(timestamp),
+                )
 
-        with file_path.open("w", newline="", encoding="utf-8") as f:
+        with _atomic_open(
+            file_path, newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE
+        ) as f:
             writer = csv.writer(f)
             writer.writerow(
                 [
@@ -779,28 +1153,9 @@ class ExportsView(QWidget):
                     "timestamp",
                 ]
             )
+            writer.writerows(rows())
 
-            for ta, t in records:
-                writer.writerow(
-                    [
-                        ta.id,
-                        t.id,
-                        t.first_name or "",
-                        t.last_name or "",
-                        ta.date.isoformat() if ta.date else "",
-                        ta.status or "",
-                        ta.check_in_time.isoformat()
-                        if ta.check_in_time
-                        else "",
-                        ta.check_out_time.isoformat()
-                        if ta.check_out_time
-                        else "",
-                        ta.marked_by or "",
-                        ta.timestamp.isoformat() if ta.timestamp else "",
-                    ]
-                )
-
-        return len(records)
+        return count
 
     def export_attendance_csv(self):
         out_dir = self._subdir("attendance", "daily")
@@ -846,89 +1201,80 @@ class ExportsView(QWidget):
         total_teacher_att_records = len(teach_records)
 
         # Count student attendance by status, **unique per (student, date, status)**
-        student_status_counts: dict[str, int] = {}
-        seen_student_keys = set()
-        for a in stu_records:
-            status_label = (a.status or "").strip() or "(blank)"
-            key = (a.student_id, a.date, status_label)
-            if key in seen_student_keys:
-                continue
-            seen_student_keys.add(key)
-            student_status_counts[status_label] = student_status_counts.get(status_label, 0) + 1
+        unique_student = dict.fromkeys(
+            (a.student_id, a.date, _status_label(a.status)) for a in stu_records
+        )
+        student_status_counts = Counter(label for _sid, _day, label in unique_student)
 
         # Count teacher attendance by status, **unique per (teacher, date, status)**
-        teacher_status_counts: dict[str, int] = {}
-        seen_teacher_keys = set()
-        for ta in teach_records:
-            status_label = (ta.status or "").strip() or "(blank)"
-            key = (ta.teacher_id, ta.date, status_label)
-            if key in seen_teacher_keys:
-                continue
-            seen_teacher_keys.add(key)
-            teacher_status_counts[status_label] = teacher_status_counts.get(status_label, 0) + 1
-
-        # Create PDF
-        c = canvas.Canvas(str(file_path), pagesize=letter)
-        width, height = letter
-
-        y = height - 72  # 1 inch margin from top
-
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(72, y, f"RegisTree Daily Summary - {att_date.isoformat()}")
-        y -= 36
-
-        c.setFont("Helvetica", 12)
-        c.drawString(72, y, f"Total Students: {total_students}")
-        y -= 20
-        c.drawString(72, y, f"Total Classes: {total_classes}")
-        y -= 20
-        c.drawString(72, y, f"Total Teachers: {total_teachers}")
-        y -= 20
-        c.drawString(
-            72,
-            y,
-            f"Student Attendance Records (raw rows): {total_attendance_records}",
-        )
-        y -= 20
-        c.drawString(
-            72,
-            y,
-            f"Teacher Attendance Records (raw rows): {total_teacher_att_records}",
+        unique_teacher = dict.fromkeys(
+            (ta.teacher_id, ta.date, _status_label(ta.status)) for ta in teach_records
         )
-        y -= 30
-
-        # Student status summary
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Unique Student Attendance by Status:")
-        y -= 20
+        teacher_status_counts = Counter(label for _tid, _day, label in unique_teacher)
 
-        c.setFont("Helvetica", 12)
-        if student_status_counts:
-            for status, count in student_status_counts.items():
-                c.drawString(90, y, f"{status}: {count}")
+        # Create PDF
+        with _atomic_output(file_path) as tmp_path:
+            c = canvas.Canvas(str(tmp_path), pagesize=letter)
+            width, height = letter
+
+            y = height - 72  # 1 inch margin from top
+
+            c.setFont("Helvetica-Bold", 16)
+            c.drawString(72, y, f"RegisTree Daily Summary - {att_date.isoformat()}")
+            y -= 36
+
+            c.setFont("Helvetica", 12)
+            c.drawString(72, y, f"Total Students: {total_students}")
+            y -= 20
+            c.drawString(72, y, f"Total Classes: {total_classes}")
+            y -= 20
+            c.drawString(72, y, f"Total Teachers: {total_teachers}")
+            y -= 20
+            c.drawString(
+                72,
+                y,
+                f"Student Attendance Records (raw rows): {total_attendance_records}",
+            )
+            y -= 20
+            c.drawString(
+                72,
+                y,
+                f"Teacher Attendance Records (raw rows): {total_teacher_att_records}",
+            )
+            y -= 30
+
+            # Student status summary
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(72, y, "Unique Student Attendance by Status:")
+            y -= 20
+
+            c.setFont("Helvetica", 12)
+            if student_status_counts:
+                for status, count in student_status_counts.items():
+                    c.drawString(90, y, f"{status}: {count}")
+                    y -= 18
+            else:
+                c.drawString(90, y, "No student attendance records for this date.")
                 y -= 18
-        else:
-            c.drawString(90, y, "No student attendance records for this date.")
-            y -= 18
 
-        y -= 20
+            y -= 20
 
-        # Teacher status summary
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Unique Teacher Attendance by Status:")
-        y -= 20
+            # Teacher status summary
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(72, y, "Unique Teacher Attendance by Status:")
+            y -= 20
 
-        c.setFont("Helvetica", 12)
-        if teacher_status_counts:
-            for status, count in teacher_status_counts.items():
-                c.drawString(90, y, f"{status}: {count}")
+            c.setFont("Helvetica", 12)
+            if teacher_status_counts:
+                for status, count in teacher_status_counts.items():
+                    c.drawString(90, y, f"{status}: {count}")
+                    y -= 18
+            else:
+                c.drawString(90, y, "No teacher attendance records for this date.")
                 y -= 18
-        else:
-            c.drawString(90, y, "No teacher attendance records for this date.")
-            y -= 18
 
-        c.showPage()
-        c.save()
+            c.showPage()
+            c.save()
 
     # ------------------------------------------------------------------
     # Generate daily bundle (students.json + attendance CSVs + PDF)
@@ -983,111 +1329,112 @@ class ExportsView(QWidget):
         out_dir = self._subdir("summaries", "students")
         file_path = out_dir / f"student_{student_id}_summary.pdf"
 
-        c = canvas.Canvas(str(file_path), pagesize=letter)
-        width, height = letter
-        y = height - 72
+        with _atomic_output(file_path) as tmp_path:
+            c = canvas.Canvas(str(tmp_path), pagesize=letter)
+            width, height = letter
+            y = height - 72
 
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(72, y, f"Student Summary - ID {student.id}")
-        y -= 30
+            c.setFont("Helvetica-Bold", 16)
+            c.drawString(72, y, f"Student Summary - ID {student.id}")
+            y -= 30
 
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Basic Information")
-        y -= 18
-        c.setFont("Helvetica", 11)
-        c.drawString(
-            90, y, f"Name: {student.first_name or ''} {student.last_name or ''}"
-        )
-        y -= 16
-        c.drawString(90, y, f"Grade: {student.grade_level or ''}")
-        y -= 16
-        c.drawString(90, y, f"Status: {student.status or ''}")
-        y -= 16
-        c.drawString(
-            90,
-            y,
-            f"DOB: {student.dob.isoformat() if student.dob else ''}",
-        )
-        y -= 16
-        c.drawString(90, y, f"Email: {student.contact_email or ''}")
-        y -= 24
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(72, y, "Basic Information")
+            y -= 18
+            c.setFont("Helvetica", 11)
+            c.drawString(
+                90, y, f"Name: {student.first_name or ''} {student.last_name or ''}"
+            )
+            y -= 16
+            c.drawString(90, y, f"Grade: {student.grade_level or ''}")
+            y -= 16
+            c.drawString(90, y, f"Status: {student.status or ''}")
+            y -= 16
+            c.drawString(
+                90,
+                y,
+                f"DOB: {student.dob.isoformat() if student.dob else ''}",
+            )
+            y -= 16
+            c.drawString(90, y, f"Email: {student.contact_email or ''}")
+            y -= 24
 
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Guardian & Emergency Contacts")
-        y -= 18
-        c.setFont("Helvetica", 11)
-        c.drawString(90, y, f"Guardian: {student.guardian_name or ''}")
-        y -= 16
-        c.drawString(90, y, f"Guardian Phone: {student.guardian_phone or ''}")
-        y -= 16
-        c.drawString(
-            90,
-            y,
-            f"Guardian Email: {getattr(student, 'guardian_email', '') or ''}",
-        )
-        y -= 16
-        c.drawString(
-            90,
-            y,
-            f"Emergency Contact: {getattr(student, 'emergency_contact_name', '') or ''}",
-        )
-        y -= 16
-        c.drawString(
-            90,
-            y,
-            "Emergency Phone: "
-            f"{getattr(student, 'emergency_contact_phone', '') or ''}",
-        )
-        y -= 24
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(72, y, "Guardian & Emergency Contacts")
+            y -= 18
+            c.setFont("Helvetica", 11)
+            c.drawString(90, y, f"Guardian: {student.guardian_name or ''}")
+            y -= 16
+            c.drawString(90, y, f"Guardian Phone: {student.guardian_phone or ''}")
+            y -= 16
+            c.drawString(
+                90,
+                y,
+                f"Guardian Email: {getattr(student, 'guardian_email', '') or ''}",
+            )
+            y -= 16
+            c.drawString(
+                90,
+                y,
+                f"Emergency Contact: {getattr(student, 'emergency_contact_name', '') or ''}",
+            )
+            y -= 16
+            c.drawString(
+                90,
+                y,
+                "Emergency Phone: "
+                f"{getattr(student, 'emergency_contact_phone', '') or ''}",
+            )
+            y -= 24
 
-        # Classes
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Classes")
-        y -= 18
-        c.setFont("Helvetica", 11)
+            # Classes
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(72, y, "Classes")
+            y -= 18
+            c.setFont("Helvetica", 11)
+
+            enrolls = (
+                self.session.query(Enrollment, Class)
+                .join(Class, Enrollment.class_id == Class.id)
+                .filter(Enrollment.student_id == student.id)
+                .order_by(Class.term, Class.name)
+                .all()
+            )
+            if enrolls:
+                for e, cl in enrolls:
+                    text = (
+                        f"{cl.name or ''} | {cl.subject or ''} | "
+                        f"{cl.term or ''} | "
+                        f"{e.start_date.isoformat() if e.start_date else ''} - "
+                        f"{e.end_date.isoformat() if e.end_date else ''}"
+                    )
+                    c.drawString(90, y, text)
+                    y -= 14
+                    if y < 72:
+                        c.showPage()
+                        y = height - 72
+                        c.setFont("Helvetica", 11)
+            else:
+                c.drawString(90, y, "No enrollments found.")
+                y -= 16
 
-        enrolls = (
-            self.session.query(Enrollment, Class)
-            .join(Class, Enrollment.class_id == Class.id)
-            .filter(Enrollment.student_id == student.id)
-            .order_by(Class.term, Class.name)
-            .all()
-        )
-        if enrolls:
-            for e, cl in enrolls:
-                text = (
-                    f"{cl.name or ''} | {cl.subject or ''} | "
-                    f"{cl.term or ''} | "
-                    f"{e.start_date.isoformat() if e.start_date else ''} - "
-                    f"{e.end_date.isoformat() if e.end_date else ''}"
-                )
-                c.drawString(90, y, text)
+            # Notes
+            y -= 16
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(72, y, "Notes")
+            y -= 18
+            c.setFont("Helvetica", 11)
+            notes = student.notes or ""
+            for line in notes.splitlines() or ["(none)"]:
+                c.drawString(90, y, line)
                 y -= 14
                 if y < 72:
                     c.showPage()
                     y = height - 72
                     c.setFont("Helvetica", 11)
-        else:
-            c.drawString(90, y, "No enrollments found.")
-            y -= 16
-
-        # Notes
-        y -= 16
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Notes")
-        y -= 18
-        c.setFont("Helvetica", 11)
-        notes = student.notes or ""
-        for line in notes.splitlines() or ["(none)"]:
-            c.drawString(90, y, line)
-            y -= 14
-            if y < 72:
-                c.showPage()
-                y = height - 72
-                c.setFont("Helvetica", 11)
 
-        c.showPage()
-        c.save()
+            c.showPage()
+            c.save()
 
         QMessageBox.information(
             self,
@@ -1112,93 +1459,94 @@ class ExportsView(QWidget):
         out_dir = self._subdir("summaries", "teachers")
         file_path = out_dir / f"teacher_{teacher_id}_summary.pdf"
 
-        c = canvas.Canvas(str(file_path), pagesize=letter)
-        width, height = letter
-        y = height - 72
+        with _atomic_output(file_path) as tmp_path:
+            c = canvas.Canvas(str(tmp_path), pagesize=letter)
+            width, height = letter
+            y = height - 72
 
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(72, y, f"Teacher Summary - ID {teacher.id}")
-        y -= 30
+            c.setFont("Helvetica-Bold", 16)
+            c.drawString(72, y, f"Teacher Summary - ID {teacher.id}")
+            y -= 30
 
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Basic Information")
-        y -= 18
-        c.setFont("Helvetica", 11)
-        c.drawString(
-            90, y, f"Name: {teacher.first_name or ''} {teacher.last_name or ''}"
-        )
-        y -= 16
-        c.drawString(90, y, f"Status: {teacher.status or ''}")
-        y -= 16
-        c.drawString(90, y, f"Phone: {teacher.phone or ''}")
-        y -= 16
-        c.drawString(90, y, f"Email: {teacher.email or ''}")
-        y -= 24
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(72, y, "Basic Information")
+            y -= 18
+            c.setFont("Helvetica", 11)
+            c.drawString(
+                90, y, f"Name: {teacher.first_name or ''} {teacher.last_name or ''}"
+            )
+            y -= 16
+            c.drawString(90, y, f"Status: {teacher.status or ''}")
+            y -= 16
+            c.drawString(90, y, f"Phone: {teacher.phone or ''}")
+            y -= 16
+            c.drawString(90, y, f"Email: {teacher.email or ''}")
+            y -= 24
 
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Emergency Contact")
-        y -= 18
-        c.setFont("Helvetica", 11)
-        c.drawString(
-            90,
-            y,
-            f"Name: {getattr(teacher, 'emergency_contact_name', '') or ''}",
-        )
-        y -= 16
-        c.drawString(
-            90,
-            y,
-            f"Phone: {getattr(teacher, 'emergency_contact_phone', '') or ''}",
-        )
-        y -= 24
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(72, y, "Emergency Contact")
+            y -= 18
+            c.setFont("Helvetica", 11)
+            c.drawString(
+                90,
+                y,
+                f"Name: {getattr(teacher, 'emergency_contact_name', '') or ''}",
+            )
+            y -= 16
+            c.drawString(
+                90,
+                y,
+                f"Phone: {getattr(teacher, 'emergency_contact_phone', '') or ''}",
+            )
+            y -= 24
 
-        # Classes
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Classes")
-        y -= 18
-        c.setFont("Helvetica", 11)
+            # Classes
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(72, y, "Classes")
+            y -= 18
+            c.setFont("Helvetica", 11)
 
-        links = (
-            self.session.query(TeacherClassLink)
-            .filter(TeacherClassLink.teacher_id == teacher.id)
-            .all()
-        )
-        if links:
-            for link in links:
-                cl = link.clazz
-                if cl is None:
-                    continue
-                text = (
-                    f"{cl.name or ''} | {cl.subject or ''} | "
-                    f"{cl.term or ''} | Room {cl.room or ''}"
-                )
-                c.drawString(90, y, text)
+            links = (
+                self.session.query(TeacherClassLink)
+                .filter(TeacherClassLink.teacher_id == teacher.id)
+                .all()
+            )
+            if links:
+                for link in links:
+                    cl = link.clazz
+                    if cl is None:
+                        continue
+                    text = (
+                        f"{cl.name or ''} | {cl.subject or ''} | "
+                        f"{cl.term or ''} | Room {cl.room or ''}"
+                    )
+                    c.drawString(90, y, text)
+                    y -= 14
+                    if y < 72:
+                        c.showPage()
+                        y = height - 72
+                        c.setFont("Helvetica", 11)
+            else:
+                c.drawString(90, y, "No classes assigned.")
+                y -= 16
+
+            # Notes
+            y -= 16
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(72, y, "Notes")
+            y -= 18
+            c.setFont("Helvetica", 11)
+            notes = teacher.notes or ""
+            for line in notes.splitlines() or ["(none)"]:
+                c.drawString(90, y, line)
                 y -= 14
                 if y < 72:
                     c.showPage()
                     y = height - 72
                     c.setFont("Helvetica", 11)
-        else:
-            c.drawString(90, y, "No classes assigned.")
-            y -= 16
-
-        # Notes
-        y -= 16
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Notes")
-        y -= 18
-        c.setFont("Helvetica", 11)
-        notes = teacher.notes or ""
-        for line in notes.splitlines() or ["(none)"]:
-            c.drawString(90, y, line)
-            y -= 14
-            if y < 72:
-                c.showPage()
-                y = height - 72
-                c.setFont("Helvetica", 11)
 
-        c.showPage()
-        c.save()
+            c.showPage()
+            c.save()
 
         QMessageBox.information(
             self,
@@ -1244,7 +1592,7 @@ class ExportsView(QWidget):
             .all()
         )
 
-        with file_path.open("w", newline="", encoding="utf-8") as f:
+        with _atomic_open(file_path, newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(
                 [
@@ -1266,13 +1614,13 @@ class ExportsView(QWidget):
                         student.id,
                         student.first_name or "",
                         student.last_name or "",
-                        a.date.isoformat() if a.date else "",
+                        _iso(a.date),
                         cl.id if cl else "",
                         cl.name if cl else "",
                         cl.term if cl else "",
                         a.status or "",
                         a.marked_by or "",
-                        a.timestamp.isoformat() if a.timestamp else "",
+                        _iso(a.timestamp),
                     ]
                 )
 
@@ -1317,59 +1665,60 @@ class ExportsView(QWidget):
             .all()
         )
 
-        c = canvas.Canvas(str(file_path), pagesize=letter)
-        width, height = letter
-        y = height - 72
+        with _atomic_output(file_path) as tmp_path:
+            c = canvas.Canvas(str(tmp_path), pagesize=letter)
+            width, height = letter
+            y = height - 72
 
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(
-            72,
-            y,
-            f"Student Attendance - {student.first_name} {student.last_name}",
-        )
-        y -= 24
-        c.setFont("Helvetica", 11)
-        c.drawString(72, y, f"ID: {student.id}")
-        y -= 14
-        c.drawString(72, y, f"Range: {start} to {end}")
-        y -= 24
-
-        c.setFont("Helvetica-Bold", 11)
-        c.drawString(72, y, "Date")
-        c.drawString(150, y, "Class")
-        c.drawString(340, y, "Term")
-        c.drawString(420, y, "Status")
-        y -= 16
-        c.setFont("Helvetica", 10)
-
-        if records:
-            for a, cl in records:
-                if y < 72:
-                    c.showPage()
-                    y = height - 72
-                    c.setFont("Helvetica-Bold", 11)
-                    c.drawString(72, y, "Date")
-                    c.drawString(150, y, "Class")
-                    c.drawString(340, y, "Term")
-                    c.drawString(420, y, "Status")
-                    y -= 16
-                    c.setFont("Helvetica", 10)
-
-                c.drawString(
-                    72,
-                    y,
-                    a.date.isoformat() if a.date else "",
-                )
-                c.drawString(150, y, (cl.name or "") if cl else "")
-                c.drawString(340, y, (cl.term or "") if cl else "")
-                c.drawString(420, y, a.status or "")
-                y -= 14
-        else:
-            c.drawString(72, y, "No attendance records in this range.")
+            c.setFont("Helvetica-Bold", 16)
+            c.drawString(
+                72,
+                y,
+                f"Student Attendance - {student.first_name} {student.last_name}",
+            )
+            y -= 24
+            c.setFont("Helvetica", 11)
+            c.drawString(72, y, f"ID: {student.id}")
             y -= 14
+            c.drawString(72, y, f"Range: {start} to {end}")
+            y -= 24
+
+            c.setFont("Helvetica-Bold", 11)
+            c.drawString(72, y, "Date")
+            c.drawString(150, y, "Class")
+            c.drawString(340, y, "Term")
+            c.drawString(420, y, "Status")
+            y -= 16
+            c.setFont("Helvetica", 10)
+
+            if records:
+                for a, cl in records:
+                    if y < 72:
+                        c.showPage()
+                        y = height - 72
+                        c.setFont("Helvetica-Bold", 11)
+                        c.drawString(72, y, "Date")
+                        c.drawString(150, y, "Class")
+                        c.drawString(340, y, "Term")
+                        c.drawString(420, y, "Status")
+                        y -= 16
+                        c.setFont("Helvetica", 10)
+
+                    c.drawString(
+                        72,
+                        y,
+                        _iso(a.date),
+                    )
+                    c.drawString(150, y, (cl.name or "") if cl else "")
+                    c.drawString(340, y, (cl.term or "") if cl else "")
+                    c.drawString(420, y, a.status or "")
+                    y -= 14
+            else:
+                c.drawString(72, y, "No attendance records in this range.")
+                y -= 14
 
-        c.showPage()
-        c.save()
+            c.showPage()
+            c.save()
 
         QMessageBox.information(
             self,
@@ -1410,7 +1759,7 @@ class ExportsView(QWidget):
             .all()
         )
 
-        with file_path.open("w", newline="", encoding="utf-8") as f:
+        with _atomic_open(file_path, newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(
                 [
@@ -1432,13 +1781,13 @@ class ExportsView(QWidget):
                         clazz.id,
                         clazz.name or "",
                         clazz.term or "",
-                        a.date.isoformat() if a.date else "",
+                        _iso(a.date),
                         s.id,
                         s.first_name or "",
                         s.last_name or "",
                         a.status or "",
                         a.marked_by or "",
-                        a.timestamp.isoformat() if a.timestamp else "",
+                        _iso(a.timestamp),
                     ]
                 )
 
@@ -1481,60 +1830,61 @@ class ExportsView(QWidget):
             .all()
         )
 
-        c = canvas.Canvas(str(file_path), pagesize=letter)
-        width, height = letter
-        y = height - 72
-
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(
-            72,
-            y,
-            f"Class Attendance - {clazz.name or ''} ({clazz.term or ''})",
-        )
-        y -= 24
-        c.setFont("Helvetica", 11)
-        c.drawString(72, y, f"ID: {clazz.id}")
-        y -= 14
-        c.drawString(72, y, f"Range: {start} to {end}")
-        y -= 24
+        with _atomic_output(file_path) as tmp_path:
+            c = canvas.Canvas(str(tmp_path), pagesize=letter)
+            width, height = letter
+            y = height - 72
 
-        c.setFont("Helvetica-Bold", 11)
-        c.drawString(72, y, "Date")
-        c.drawString(150, y, "Student")
-        c.drawString(340, y, "Status")
-        y -= 16
-        c.setFont("Helvetica", 10)
+            c.setFont("Helvetica-Bold", 16)
+            c.drawString(
+                72,
+                y,
+                f"Class Attendance - {clazz.name or ''} ({clazz.term or ''})",
+            )
+            y -= 24
+            c.setFont("Helvetica", 11)
+            c.drawString(72, y, f"ID: {clazz.id}")
+            y -= 14
+            c.drawString(72, y, f"Range: {start} to {end}")
+            y -= 24
 
-        if records:
-            for a, s in records:
-                if y < 72:
-                    c.showPage()
-                    y = height - 72
-                    c.setFont("Helvetica-Bold", 11)
-                    c.drawString(72, y, "Date")
-                    c.drawString(150, y, "Student")
-                    c.drawString(340, y, "Status")
-                    y -= 16
-                    c.setFont("Helvetica", 10)
-
-                c.drawString(
-                    72,
-                    y,
-                    a.date.isoformat() if a.date else "",
-                )
-                c.drawString(
-                    150,
-                    y,
-                    f"{s.last_name or ''}, {s.first_name or ''}",
-                )
-                c.drawString(340, y, a.status or "")
+            c.setFont("Helvetica-Bold", 11)
+            c.drawString(72, y, "Date")
+            c.drawString(150, y, "Student")
+            c.drawString(340, y, "Status")
+            y -= 16
+            c.setFont("Helvetica", 10)
+
+            if records:
+                for a, s in records:
+                    if y < 72:
+                        c.showPage()
+                        y = height - 72
+                        c.setFont("Helvetica-Bold", 11)
+                        c.drawString(72, y, "Date")
+                        c.drawString(150, y, "Student")
+                        c.drawString(340, y, "Status")
+                        y -= 16
+                        c.setFont("Helvetica", 10)
+
+                    c.drawString(
+                        72,
+                        y,
+                        _iso(a.date),
+                    )
+                    c.drawString(
+                        150,
+                        y,
+                        f"{s.last_name or ''}, {s.first_name or ''}",
+                    )
+                    c.drawString(340, y, a.status or "")
+                    y -= 14
+            else:
+                c.drawString(72, y, "No attendance records in this range.")
                 y -= 14
-        else:
-            c.drawString(72, y, "No attendance records in this range.")
-            y -= 14
 
-        c.showPage()
-        c.save()
+            c.showPage()
+            c.save()
 
         QMessageBox.information(
             self,
@@ -1580,7 +1930,7 @@ class ExportsView(QWidget):
             .all()
         )
 
-        with file_path.open("w", newline="", encoding="utf-8") as f:
+        with _atomic_open(file_path, newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(
                 [
@@ -1602,12 +1952,12 @@ class ExportsView(QWidget):
                         teacher.id,
                         teacher.first_name or "",
                         teacher.last_name or "",
-                        ta.date.isoformat() if ta.date else "",
+                        _iso(ta.date),
                         ta.status or "",
-                        ta.check_in_time.isoformat() if ta.check_in_time else "",
-                        ta.check_out_time.isoformat() if ta.check_out_time else "",
+                        _iso(ta.check_in_time),
+                        _iso(ta.check_out_time),
                         ta.marked_by or "",
-                        ta.timestamp.isoformat() if ta.timestamp else "",
+                        _iso(ta.timestamp),
                     ]
                 )
 
@@ -1655,71 +2005,72 @@ class ExportsView(QWidget):
             .all()
         )
 
-        c = canvas.Canvas(str(file_path), pagesize=letter)
-        width, height = letter
-        y = height - 72
-
-        # Header
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(
-            72,
-            y,
-            f"Teacher Attendance - {teacher.first_name or ''} {teacher.last_name or ''}",
-        )
-        y -= 24
-        c.setFont("Helvetica", 11)
-        c.drawString(72, y, f"ID: {teacher.id}")
-        y -= 14
-        c.drawString(72, y, f"Range: {start} to {end}")
-        y -= 24
-
-        # Column headers
-        c.setFont("Helvetica-Bold", 11)
-        c.drawString(72, y, "Date")
-        c.drawString(170, y, "Status")
-        c.drawString(280, y, "Check-In")
-        c.drawString(370, y, "Check-Out")
-        y -= 16
-        c.setFont("Helvetica", 10)
-
-        if records:
-            for ta in records:
-                # New page if we’re near bottom
-                if y < 72:
-                    c.showPage()
-                    y = height - 72
-                    c.setFont("Helvetica-Bold", 11)
-                    c.drawString(72, y, "Date")
-                    c.drawString(170, y, "Status")
-                    c.drawString(280, y, "Check-In")
-                    c.drawString(370, y, "Check-Out")
-                    y -= 16
-                    c.setFont("Helvetica", 10)
-
-                date_str = ta.date.isoformat() if ta.date else ""
-                status_str = ta.status or ""
-                check_in_str = (
-                    ta.check_in_time.strftime("%H:%M")
-                    if ta.check_in_time
-                    else ""
-                )
-                check_out_str = (
-                    ta.check_out_time.strftime("%H:%M")
-                    if ta.check_out_time
-                    else ""
-                )
+        with _atomic_output(file_path) as tmp_path:
+            c = canvas.Canvas(str(tmp_path), pagesize=letter)
+            width, height = letter
+            y = height - 72
 
-                c.drawString(72, y, date_str)
-                c.drawString(170, y, status_str)
-                c.drawString(280, y, check_in_str)
-                c.drawString(370, y, check_out_str)
-                y -= 14
-        else:
-            c.drawString(72, y, "No teacher attendance records in this range.")
+            # Header
+            c.setFont("Helvetica-Bold", 16)
+            c.drawString(
+                72,
+                y,
+                f"Teacher Attendance - {teacher.first_name or ''} {teacher.last_name or ''}",
+            )
+            y -= 24
+            c.setFont("Helvetica", 11)
+            c.drawString(72, y, f"ID: {teacher.id}")
             y -= 14
+            c.drawString(72, y, f"Range: {start} to {end}")
+            y -= 24
+
+            # Column headers
+            c.setFont("Helvetica-Bold", 11)
+            c.drawString(72, y, "Date")
+            c.drawString(170, y, "Status")
+            c.drawString(280, y, "Check-In")
+            c.drawString(370, y, "Check-Out")
+            y -= 16
+            c.setFont("Helvetica", 10)
+
+            if records:
+                for ta in records:
+                    # New page if we’re near bottom
+                    if y < 72:
+                        c.showPage()
+                        y = height - 72
+                        c.setFont("Helvetica-Bold", 11)
+                        c.drawString(72, y, "Date")
+                        c.drawString(170, y, "Status")
+                        c.drawString(280, y, "Check-In")
+                        c.drawString(370, y, "Check-Out")
+                        y -= 16
+                        c.setFont("Helvetica", 10)
+
+                    date_str = _iso(ta.date)
+                    status_str = ta.status or ""
+                    check_in_str = (
+                        ta.check_in_time.strftime("%H:%M")
+                        if ta.check_in_time
+                        else ""
+                    )
+                    check_out_str = (
+                        ta.check_out_time.strftime("%H:%M")
+                        if ta.check_out_time
+                        else ""
+                    )
+
+                    c.drawString(72, y, date_str)
+                    c.drawString(170, y, status_str)
+                    c.drawString(280, y, check_in_str)
+                    c.drawString(370, y, check_out_str)
+                    y -= 14
+            else:
+                c.drawString(72, y, "No teacher attendance records in this range.")
+                y -= 14
 
-        c.showPage()
-        c.save()
+            c.showPage()
+            c.save()
 
         QMessageBox.information(
             self,
@@ -1727,22 +2078,41 @@ class ExportsView(QWidget):
             f"Teacher attendance PDF created:\n{file_path}",
         )
 
-    def export_monthly_summary_pdf(self):
+    def _monthly_summary_fingerprint(self, month_start: date, month_end: date):
         """
-        Monthly summary for the month containing the 'From' date.
-        Aggregates attendance counts by status (unique per student/date/status)
-        and by class, and also shows teacher attendance status totals.
+        Cheap change-detector for a month of attendance: row counts plus the
+        latest timestamp for student and teacher attendance in the range.
+        Any insert, delete, or re-mark (which bumps timestamp) changes it.
         """
-        qs = self.range_start_edit.date()
-        month_start = date(qs.year(), qs.month(), 1)
-        if qs.month == 12:
-            next_month = date(qs.year() + 1, 1, 1)
-        else:
-            next_month = date(qs.year(), qs.month() + 1, 1)
-        month_end = next_month - timedelta(days=1)
+        att = (
+            self.session.query(func.count(Attendance.id), func.max(Attendance.timestamp))
+            .filter(Attendance.date >= month_start, Attendance.date <= month_end)
+            .one()
+        )
+        teacher_att = (
+            self.session.query(
+                func.count(TeacherAttendance.id), func.max(TeacherAttendance.timestamp)
+            )
+            .filter(
+                TeacherAttendance.date >= month_start,
+                TeacherAttendance.date <= month_end,
+            )
+            .one()
+        )
+        return tuple(att), tuple(teacher_att)
 
-        out_dir = self._subdir("reports", "attendance", "monthly")
-        file_path = out_dir / f"monthly_summary_{month_start.year}_{month_start.month:02d}.pdf"
+    def _monthly_summary_counts(self, month_start: date, month_end: date):
+        """
+        Return (status_counts, class_id_counts, teacher_status_counts) for the
+        month, reusing the cached aggregates when the month's attendance has
+        not changed since they were computed.
+        """
+        key = (month_start, month_end)
+        fingerprint = self._monthly_summary_fingerprint(month_start, month_end)
+
+        cached = self._monthly_summary_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
 
         # Student attendance records (with class)
         records = (
@@ -1765,108 +2135,73 @@ class ExportsView(QWidget):
             .all()
         )
 
-        # Aggregate student attendance
-        status_counts: dict[str, int] = {}
-        class_counts: dict[str, int] = {}
-        seen_status_keys = set()  # (student_id, date, status_label)
-
-        for a, cl in records:
-            status_label = (a.status or "").strip() or "(blank)"
-            skey = (a.student_id, a.date, status_label)
-            if skey not in seen_status_keys:
-                seen_status_keys.add(skey)
-                status_counts[status_label] = status_counts.get(status_label, 0) + 1
-
-            if cl is not None:
-                cname = f"{cl.name or ''} ({cl.term or ''})"
-                class_counts[cname] = class_counts.get(cname, 0) + 1
-
-        # Aggregate teacher attendance
-        teacher_status_counts: dict[str, int] = {}
-        seen_teacher_keys = set()  # (teacher_id, date, status_label)
-
-        for ta in teacher_records:
-            status_label = (ta.status or "").strip() or "(blank)"
-            skey = (ta.teacher_id, ta.date, status_label)
-            if skey not in seen_teacher_keys:
-                seen_teacher_keys.add(skey)
-                teacher_status_counts[status_label] = teacher_status_counts.get(status_label, 0) + 1
-
-        c = canvas.Canvas(str(file_path), pagesize=letter)
-        width, height = letter
-        y = height - 72
-
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(
-            72,
-            y,
-            f"Monthly Attendance Summary - {month_start.year}-{month_start.month:02d}",
+        # Aggregate student attendance: status totals are unique per
+        # (student_id, date, status_label); dict.fromkeys keeps first-seen order.
+        unique_student = dict.fromkeys(
+            (a.student_id, a.date, _status_label(a.status)) for a, _cl in records
         )
-        y -= 30
-
-        c.setFont("Helvetica", 11)
-        c.drawString(72, y, f"Date range: {month_start} to {month_end}")
-        y -= 24
+        status_counts = Counter(label for _sid, _day, label in unique_student)
+        class_id_counts = Counter(cl.id for _a, cl in records if cl is not None)
 
-        # Student status totals
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Student Attendance: Unique totals by Status")
-        y -= 18
-        c.setFont("Helvetica", 11)
-        if status_counts:
-            for status, count in status_counts.items():
-                c.drawString(90, y, f"{status}: {count}")
-                y -= 16
-                if y < 72:
-                    c.showPage()
-                    y = height - 72
-                    c.setFont("Helvetica", 11)
-        else:
-            c.drawString(90, y, "No student attendance records for this month.")
-            y -= 16
+        # Aggregate teacher attendance, unique per (teacher_id, date, status_label)
+        unique_teacher = dict.fromkeys(
+            (ta.teacher_id, ta.date, _status_label(ta.status)) for ta in teacher_records
+        )
+        teacher_status_counts = Counter(label for _tid, _day, label in unique_teacher)
 
-        y -= 16
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Student Attendance: Total rows by Class")
-        y -= 18
-        c.setFont("Helvetica", 11)
-        if class_counts:
-            for cname, count in class_counts.items():
-                c.drawString(90, y, f"{cname}: {count}")
-                y -= 16
-                if y < 72:
-                    c.showPage()
-                    y = height - 72
-                    c.setFont("Helvetica", 11)
-        else:
-            c.drawString(90, y, "No class attendance records for this month.")
-            y -= 16
+        counts = (status_counts, class_id_counts, teacher_status_counts)
+        self._monthly_summary_cache[key] = (fingerprint, counts)
+        return counts
 
-        # Teacher status totals
-        y -= 20
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(72, y, "Teacher Attendance: Unique totals by Status")
-        y -= 18
-        c.setFont("Helvetica", 11)
-        if teacher_status_counts:
-            for status, count in teacher_status_counts.items():
-                c.drawString(90, y, f"{status}: {count}")
-                y -= 16
-                if y < 72:
-                    c.showPage()
-                    y = height - 72
-                    c.setFont("Helvetica", 11)
+    def export_monthly_summary_pdf(self):
+        """
+        Monthly summary for the month containing the 'From' date.
+        Aggregates attendance counts by status (unique per student/date/status)
+        and by class, and also shows teacher attendance status totals.
+        """
+        qs = self.range_start_edit.date()
+        month_start = date(qs.year(), qs.month(), 1)
+        if qs.month() == 12:
+            next_month = date(qs.year() + 1, 1, 1)
         else:
-            c.drawString(90, y, "No teacher attendance records for this month.")
-            y -= 16
+            next_month = date(qs.year(), qs.month() + 1, 1)
+        month_end = next_month - timedelta(days=1)
 
-        c.showPage()
-        c.save()
+        out_dir = self._subdir("reports", "attendance", "monthly")
+        file_path = out_dir / f"monthly_summary_{month_start.year}_{month_start.month:02d}.pdf"
 
-        QMessageBox.information(
-            self,
+        status_counts, class_id_counts, teacher_status_counts = (
+            self._monthly_summary_counts(month_start, month_end)
+        )
+
+        # Class labels are resolved on every export so renamed classes show
+        # their current name even when the counts come from the cache.
+        class_labels = {
+            cid: f"{name or ''} ({term or ''})"
+            for cid, name, term in self.session.query(
+                Class.id, Class.name, Class.term
+            ).filter(Class.id.in_(list(class_id_counts)))
+        }
+        class_counts = Counter()
+        for cid, count in class_id_counts.items():
+            cname = class_labels.get(cid)
+            if cname is not None:
+                class_counts[cname] += count
+
+        # The counts come from the GUI thread (the session is not thread-safe);
+        # only the PDF rendering runs on the thread pool.
+        self._start_background_task(
+            lambda: _write_monthly_summary_pdf(
+                file_path,
+                month_start,
+                month_end,
+                status_counts,
+                class_counts,
+                teacher_status_counts,
+            ),
             "Monthly Summary",
-            f"Monthly summary PDF created:\n{file_path}",
+            self.monthly_summary_button,
+            "Failed to create monthly summary",
         )
 
     def export_absence_list_csv(self):
@@ -1881,26 +2216,57 @@ class ExportsView(QWidget):
         out_dir = self._subdir("reports", "attendance", "absences")
         file_path = out_dir / f"absence_list_{start}_{end}.csv"
 
-        records = (
-            self.session.query(Attendance, Student, Class)
+        stmt = (
+            select(
+                Attendance.date,
+                Student.id,
+                Student.first_name,
+                Student.last_name,
+                Class.id,
+                Class.name,
+                Class.term,
+                Attendance.status,
+            )
             .join(Student, Attendance.student_id == Student.id)
             .join(Class, Attendance.class_id == Class.id)
-            .filter(
+            .where(
                 Attendance.date >= start,
                 Attendance.date <= end,
+                # Only 'absent'-like statuses (case-insensitive), filtered in SQL
+                Attendance.status.ilike("%absent%"),
             )
             .order_by(Attendance.date, Class.name, Student.last_name, Student.first_name)
-            .all()
         )
+        result = self._stream_rows(stmt)
+        count = 0
+
+        def rows():
+            nonlocal count
+            for (
+                att_day,
+                student_id,
+                first_name,
+                last_name,
+                class_id,
+                class_name,
+                class_term,
+                status,
+            ) in result:
+                count += 1
+                yield (
+                    _iso(att_day),
+                    student_id,
+                    first_name or "",
+                    last_name or "",
+                    class_id,
+                    class_name or "",
+                    class_term or "",
+                    status or "",
+                )
 
-        # Filter to 'absent'-like statuses in Python (case-insensitive)
-        filtered = []
-        for a, s, cl in records:
-            status = (a.status or "").lower()
-            if "absent" in status:
-                filtered.append((a, s, cl))
-
-        with file_path.open("w", newline="", encoding="utf-8") as f:
+        with _atomic_open(
+            file_path, newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE
+        ) as f:
             writer = csv.writer(f)
             writer.writerow(
                 [
@@ -1914,24 +2280,12 @@ class ExportsView(QWidget):
                     "status",
                 ]
             )
-            for a, s, cl in filtered:
-                writer.writerow(
-                    [
-                        a.date.isoformat() if a.date else "",
-                        s.id,
-                        s.first_name or "",
-                        s.last_name or "",
-                        cl.id if cl else "",
-                        cl.name if cl else "",
-                        cl.term if cl else "",
-                        a.status or "",
-                    ]
-                )
+            writer.writerows(rows())
 
         QMessageBox.information(
             self,
             "Absence List",
-            f"Exported {len(filtered)} absent records to:\n{file_path}",
+            f"Exported {count} absent records to:\n{file_path}",
         )
 
     # ------------------------------------------------------------------
@@ -1944,54 +2298,18 @@ class ExportsView(QWidget):
         out_dir = self._subdir("reports", "attendance", "teachers")
         file_path = out_dir / "teacher_attendance_log.csv"
 
-        records = (
-            self.session.query(TeacherAttendance, Teacher)
-            .join(Teacher, TeacherAttendance.teacher_id == Teacher.id)
-            .order_by(TeacherAttendance.date, Teacher.last_name, Teacher.first_name, TeacherAttendance.id)
-            .all()
+        stmt = self._teacher_attendance_select().order_by(
+            TeacherAttendance.date,
+            Teacher.last_name,
+            Teacher.first_name,
+            TeacherAttendance.id,
         )
-
-        with file_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    "id",
-                    "teacher_id",
-                    "teacher_first_name",
-                    "teacher_last_name",
-                    "date",
-                    "status",
-                    "check_in_time",
-                    "check_out_time",
-                    "marked_by",
-                    "timestamp",
-                ]
-            )
-
-            for ta, t in records:
-                writer.writerow(
-                    [
-                        ta.id,
-                        t.id,
-                        t.first_name or "",
-                        t.last_name or "",
-                        ta.date.isoformat() if ta.date else "",
-                        ta.status or "",
-                        ta.check_in_time.isoformat()
-                        if ta.check_in_time
-                        else "",
-                        ta.check_out_time.isoformat()
-                        if ta.check_out_time
-                        else "",
-                        ta.marked_by or "",
-                        ta.timestamp.isoformat() if ta.timestamp else "",
-                    ]
-                )
+        count = self._write_teacher_attendance_csv(file_path, stmt)
 
         QMessageBox.information(
             self,
             "Teacher Attendance Log",
-            f"Exported {len(records)} teacher attendance records to:\n{file_path}",
+            f"Exported {count} teacher attendance records to:\n{file_path}",
         )
 
     # ------------------------------------------------------------------
@@ -2007,15 +2325,7 @@ class ExportsView(QWidget):
         base = self._get_exports_dir()  # ensures it exists
 
         try:
-            if sys.platform.startswith("win"):
-                # Windows
-                os.startfile(base)  # type: ignore[attr-defined]
-            elif sys.platform == "darwin":
-                # macOS
-                subprocess.Popen(["open", str(base)])
-            else:
-                # Linux / other
-                subprocess.Popen(["xdg-open", str(base)])
+            _open_in_file_manager(str(base))
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -2048,20 +2358,15 @@ class ExportsView(QWidget):
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         backup_path = backups_dir / f"registree_backup_{timestamp}.db"
 
-        try:
-            shutil.copy2(DB_FILE, backup_path)
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Backup Database",
-                f"Failed to backup database:\n{e}",
-            )
-            return
+        def run_backup():
+            _backup_sqlite_db(DB_FILE, backup_path)
+            return f"Database successfully backed up to:\n{backup_path}"
 
-        QMessageBox.information(
-            self,
+        self._start_background_task(
+            run_backup,
             "Backup Database",
-            f"Database successfully backed up to:\n{backup_path}",
+            self.backup_button,
+            "Failed to backup database",
         )
 
     # ------------------------------------------------------------------
@@ -2078,27 +2383,40 @@ class ExportsView(QWidget):
         backup_dir = backups_root / f"registree_full_backup_{timestamp}"
         backup_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy database
-        if DB_FILE.exists():
-            shutil.copy2(DB_FILE, backup_dir / DB_FILE.name)
-            db_msg = f"Database copied as {DB_FILE.name}"
-        else:
-            db_msg = "Database file NOT FOUND."
-
-        # Copy photos directory (if present)
-        if PHOTOS_DIR.exists() and PHOTOS_DIR.is_dir():
-            dest_photos = backup_dir / PHOTOS_DIR.name
-            shutil.copytree(PHOTOS_DIR, dest_photos)
-            photos_msg = f"Photos folder copied ({PHOTOS_DIR})"
-        else:
-            photos_msg = "Photos folder not found; skipped."
-
-        QMessageBox.information(
-            self,
+        # Copying can take a while for large photo folders
+        self._start_background_task(
+            lambda: _run_full_backup(backup_dir),
             "Full RegisTree Backup",
-            f"Full backup created at:\n{backup_dir}\n\n{db_msg}\n{photos_msg}",
+            self.full_backup_button,
+            "Failed to create full backup",
         )
 
+    # ------------------------------------------------------------------
+    # Background tasks
+    # ------------------------------------------------------------------
+    def _start_background_task(self, fn, title, button, error_prefix):
+        """
+        Run fn() on the global thread pool with `button` disabled until it
+        finishes. The result is shown in a message box on the GUI thread.
+        """
+        task = BackgroundTask(fn)
+        task.signals.finished.connect(self._on_background_task_finished)
+        task.signals.failed.connect(self._on_background_task_failed)
+        self._background_tasks[task] = (title, button, error_prefix)
+
+        button.setEnabled(False)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_background_task_finished(self, task, message: str):
+        title, button, _ = self._background_tasks.pop(task)
+        button.setEnabled(True)
+        QMessageBox.information(self, title, message)
+
+    def _on_background_task_failed(self, task, error: str):
+        title, button, error_prefix = self._background_tasks.pop(task)
+        button.setEnabled(True)
+        QMessageBox.critical(self, title, f"{error_prefix}:\n{error}")
+
     # ------------------------------------------------------------------
     # Restore database file
     # ------------------------------------------------------------------
@@ -2176,7 +2494,7 @@ class ExportsView(QWidget):
     # ------------------------------------------------------------------
     def change_admin_password(self):
         # There should be exactly one admin user (username='admin')
-        admin = self.session.query(AdminUser).first()
+        admin = get_admin(self.session)
         if admin is None:
             QMessageBox.warning(
                 self,
@@ -2200,7 +2518,7 @@ class ExportsView(QWidget):
         if not new_pw:
             return
 
-        # Update hash in DB
+        # Update hash in DB (admin is the cached instance, so it stays current)
         admin.password_hash = hash_password(new_pw)
         self.session.commit()
 
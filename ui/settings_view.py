@@ -19,34 +19,17 @@ from PySide6.QtWidgets import (
     QTableWidgetItem,
     QAbstractItemView,
 )
-from data.models import AdminUser, AuditLog
+from data.models import AuditLog, get_admin
 from data.security import verify_password
 from ui.auth_dialogs import LoginDialog
 from PySide6.QtCore import QUrl
 from PySide6.QtGui import QDesktopServices
 import urllib.parse
 
+from data.grades import GRADE_INDEX, GRADE_SCALE
 from data.paths import EXPORTS_DIR, LOGS_DIR, APP_ROOT
 
 
-GRADE_SCALE = [
-    "PreK",
-    "K",
-    "1st",
-    "2nd",
-    "3rd",
-    "4th",
-    "5th",
-    "6th",
-    "7th",
-    "8th",
-    "9th",
-    "10th",
-    "11th",
-    "12th",
-]
-
-
 class SettingsView(QWidget):
     """
     Global application settings for RegisTree.
@@ -244,15 +227,8 @@ class SettingsView(QWidget):
         self.school_name_edit.setText(self.settings.school_name or "")
         self.academic_year_edit.setText(self.settings.academic_year or "")
 
-        # Attendance statuses
-        try:
-            raw = self.settings.attendance_statuses_json or "[]"
-            statuses = json.loads(raw)
-        except Exception:
-            statuses = self.DEFAULT_STATUSES
-
-        if not isinstance(statuses, list) or not statuses:
-            statuses = self.DEFAULT_STATUSES
+        # Attendance statuses (parse cached on the Settings row)
+        statuses = self.settings.attendance_statuses or self.DEFAULT_STATUSES
 
         self.statuses_edit.setPlainText("\n".join(statuses))
 
@@ -269,13 +245,8 @@ class SettingsView(QWidget):
         grad_grade = (self.settings.graduating_grade or "12th").strip()
 
         # Fall back if not in our canonical list
-        if start_grade not in GRADE_SCALE:
-            start_grade = "K"
-        if grad_grade not in GRADE_SCALE:
-            grad_grade = "12th"
-
-        start_index = GRADE_SCALE.index(start_grade)
-        grad_index = GRADE_SCALE.index(grad_grade)
+        start_index = GRADE_INDEX.get(start_grade, GRADE_INDEX["K"])
+        grad_index = GRADE_INDEX.get(grad_grade, GRADE_INDEX["12th"])
 
         self.starting_grade_combo.setCurrentIndex(start_index)
         self.graduating_grade_combo.setCurrentIndex(grad_index)
@@ -439,7 +410,7 @@ class SettingsView(QWidget):
             return
 
         # Step 2: Require admin password
-        admin = self.session.query(AdminUser).first()
+        admin = get_admin(self.session)
         if admin is None:
             QMessageBox.warning(
                 self,
@@ -472,7 +443,7 @@ class SettingsView(QWidget):
         """
         Prompt for admin password, then open the audit log viewer dialog.
         """
-        admin = self.session.query(AdminUser).first()
+        admin = get_admin(self.session)
         if admin is None:
             QMessageBox.warning(
                 self,
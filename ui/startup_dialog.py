@@ -12,14 +12,40 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QSizePolicy,
 )
-from PySide6.QtGui import QPixmap
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap, QPixmapCache
+from PySide6.QtCore import Qt, QThreadPool, QTimer
+
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
 
 from data.models import AdminUser
-from data.security import hash_password, verify_password
+from data.security import dummy_hash, hash_password, needs_rehash, verify_password
+from ui.background_task import BackgroundTask
 from data.paths import ICON_PATH  # 🔹 central icon path
 
 
+def _scaled_icon(size: int) -> QPixmap | None:
+    """
+    The app icon scaled to fit size x size, or None if it can't be loaded.
+    The decoded + resampled pixmap is kept in QPixmapCache, so reopening
+    the dialog skips both the file decode and the smooth rescale.
+    """
+    key = f"registree-icon-{size}"
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+
+    # Use bundled icon path from data.paths (PyInstaller-safe)
+    if not ICON_PATH.is_file():
+        return None
+    pix = QPixmap(str(ICON_PATH))
+    if pix.isNull():
+        return None
+    scaled = pix.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    QPixmapCache.insert(key, scaled)
+    return scaled
+
+
 class StartupDialog(QDialog):
     """
     Splash/loading + first-time admin setup / login dialog.
@@ -47,22 +73,10 @@ class StartupDialog(QDialog):
         # Top stretch → pushes content downward
         left_layout.addStretch()
 
+        # Filled in by _populate_deferred (icon decode + resample)
         self.icon_label = QLabel()
         self.icon_label.setAlignment(Qt.AlignCenter)
-
-        # Use bundled icon path from data.paths (PyInstaller-safe)
-        if ICON_PATH.is_file():
-            pix = QPixmap(str(ICON_PATH))
-            if not pix.isNull():
-                scaled = pix.scaled(
-                    160,
-                    160,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation,
-                )
-                self.icon_label.setPixmap(scaled)
-        else:
-            self.icon_label.setText("RegisTree")
+        self.icon_label.setMinimumSize(160, 160)
 
         left_layout.addWidget(self.icon_label, alignment=Qt.AlignHCenter)
 
@@ -110,17 +124,46 @@ class StartupDialog(QDialog):
         )
         right_col.addWidget(self.progress_bar)
 
+        # Setup/login group goes here once _populate_deferred has run
+        self._auth_slot = QVBoxLayout()
+        right_col.addLayout(self._auth_slot)
+        right_col.addStretch()
+
+        main_layout.addLayout(right_col, 1)
+
+        # Show the splash first; the DB check, auth widgets and icon are
+        # built on the next event-loop tick.
+        QTimer.singleShot(0, self._populate_deferred)
+
+    def _populate_deferred(self):
+        # Calibrate the bcrypt cost and build the dummy hash now, on the
+        # thread pool, so a Login click costs one bcrypt check whether or
+        # not an admin exists
+        self._warmup_task = BackgroundTask(dummy_hash)
+        self._warmup_task.signals.finished.connect(self._on_warmup_done)
+        self._warmup_task.signals.failed.connect(self._on_warmup_done)
+        QThreadPool.globalInstance().start(self._warmup_task)
+
+        icon = _scaled_icon(160)
+        if icon is not None:
+            self.icon_label.setPixmap(icon)
+        else:
+            self.icon_label.setText("RegisTree")
+
         # Decide whether to show first-time setup or login
         admin_exists = self.session.query(AdminUser).first() is not None
         if admin_exists:
             group = self._build_login_group()
+            first_field = self.login_password_edit
         else:
             group = self._build_first_time_setup_group()
+            first_field = self.setup_password_edit
 
-        right_col.addWidget(group)
-        right_col.addStretch()
+        self._auth_slot.addWidget(group)
+        first_field.setFocus()
 
-        main_layout.addLayout(right_col, 1)
+    def _on_warmup_done(self, task, _result):
+        self._warmup_task = None  # kept alive until it reported back
 
     # -----------------------------------------
     # First-time setup (create admin password)
@@ -154,9 +197,9 @@ class StartupDialog(QDialog):
 
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
-        create_btn = QPushButton("Create Admin and Continue")
-        create_btn.clicked.connect(self._handle_first_time_setup)
-        btn_layout.addWidget(create_btn)
+        self.create_admin_button = QPushButton("Create Admin and Continue")
+        self.create_admin_button.clicked.connect(self._handle_first_time_setup)
+        btn_layout.addWidget(self.create_admin_button)
         layout.addLayout(btn_layout)
 
         group.setLayout(layout)
@@ -174,10 +217,23 @@ class StartupDialog(QDialog):
             QMessageBox.warning(self, "Setup", "Passwords do not match.")
             return
 
+        # bcrypt is deliberately slow: hash on the thread pool so the
+        # progress bar keeps animating, then create the admin in
+        # _on_setup_hash_done.
+        self.create_admin_button.setEnabled(False)
+        self._start_auth_task(
+            lambda: hash_password(pwd),
+            self._on_setup_hash_done,
+            self.create_admin_button,
+        )
+
+    def _on_setup_hash_done(self, task, password_hash: str):
+        self._auth_task = None
+
         # Create admin user
         admin = AdminUser(
             username="admin",
-            password_hash=hash_password(pwd),
+            password_hash=password_hash,
         )
         self.session.add(admin)
         self.session.commit()
@@ -207,9 +263,9 @@ class StartupDialog(QDialog):
 
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
-        login_btn = QPushButton("Login")
-        login_btn.clicked.connect(self._handle_login)
-        btn_layout.addWidget(login_btn)
+        self.login_button = QPushButton("Login")
+        self.login_button.clicked.connect(self._handle_login)
+        btn_layout.addWidget(self.login_button)
         layout.addLayout(btn_layout)
 
         group.setLayout(layout)
@@ -220,6 +276,39 @@ class StartupDialog(QDialog):
 
         admin = self.session.query(AdminUser).first()
         if admin is None:
+            # Still run a full bcrypt check (against a dummy hash) so this
+            # path takes as long as a real attempt; reported in _on_verify_done
+            admin_id, stored_hash = None, None
+        else:
+            admin_id, stored_hash = admin.id, admin.password_hash
+
+        def verify():
+            ok = verify_password(pwd, stored_hash or dummy_hash())
+            # Upgrade a hash made with a lower cost than this machine's
+            # target. The check (which may calibrate) and the new hash both
+            # run here, off the GUI thread, and the new hash is saved before
+            # the main window starts using the session.
+            new_hash = None
+            if ok and stored_hash is not None and needs_rehash(stored_hash):
+                try:
+                    new_hash = hash_password(pwd)
+                except Exception:
+                    pass  # keep the existing (still valid) hash
+            return ok, new_hash
+
+        # Verify on the thread pool; the result arrives in _on_verify_done
+        self._login_attempt_admin_id = admin_id
+        self.login_button.setEnabled(False)
+        self._start_auth_task(verify, self._on_verify_done, self.login_button)
+
+    def _on_verify_done(self, task, result):
+        ok, new_hash = result
+        self._auth_task = None
+        self.login_button.setEnabled(True)
+        admin_id = self._login_attempt_admin_id
+        self._login_attempt_admin_id = None
+
+        if admin_id is None:
             QMessageBox.critical(
                 self,
                 "Login",
@@ -228,12 +317,53 @@ class StartupDialog(QDialog):
             )
             return
 
-        if not verify_password(pwd, admin.password_hash):
+        if not ok:
             QMessageBox.warning(self, "Login", "Incorrect password.")
             return
 
+        if new_hash is not None:
+            self._save_rehash(admin_id, new_hash)
+
         # Mark progress complete and close
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(100)
 
         self.accept()
+
+    # -----------------------------------------
+    # Password hashing off the GUI thread
+    # -----------------------------------------
+    def _start_auth_task(self, fn, on_done, button):
+        """
+        Run a bcrypt call on the thread pool; on_done(task, result) runs on
+        the GUI thread. `button` is re-enabled if the call fails.
+        """
+        task = BackgroundTask(fn)
+        task.signals.finished.connect(on_done)
+        task.signals.failed.connect(self._on_auth_task_failed)
+        self._auth_task_button = button
+        self._auth_task = task  # keep alive until it reports back
+        QThreadPool.globalInstance().start(task)
+
+    def _on_auth_task_failed(self, task, error: str):
+        self._auth_task = None
+        self._auth_task_button.setEnabled(True)
+        QMessageBox.critical(
+            self,
+            "RegisTree",
+            f"Could not check the admin password:\n{error}",
+        )
+
+    def _save_rehash(self, admin_id: int, new_hash: str):
+        """Store an upgraded admin hash in its own short transaction."""
+        try:
+            self.session.execute(
+                update(AdminUser)
+                .where(AdminUser.id == admin_id)
+                .values(password_hash=new_hash),
+                execution_options={"synchronize_session": "fetch"},
+            )
+            self.session.commit()
+        except SQLAlchemyError:
+            # Keep the existing (still valid) hash; retried on next login
+            self.session.rollback()
@@ -1,5 +1,8 @@
-import re
+from bisect import bisect_left
+from collections import OrderedDict
 from datetime import date, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 import shutil
 
@@ -8,6 +11,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QDialog,
@@ -23,36 +27,326 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QSizePolicy,
     QAbstractItemView,
+    QHeaderView,
 )
-from PySide6.QtCore import QDate, Qt
-from PySide6.QtGui import QPixmap
-from sqlalchemy import or_
-
-from data.models import Student, Class, Enrollment, Attendance, add_audit_log
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QDate,
+    QModelIndex,
+    QSignalBlocker,
+    QSortFilterProxyModel,
+    QThreadPool,
+    Qt,
+    QTimer,
+)
+from PySide6.QtGui import QImage, QPixmap
+from sqlalchemy import bindparam, case, func, select, update
+
+from data.grades import (
+    GRADE_DIGIT_RE,
+    GRADE_INDEX,
+    GRADE_SCALE,
+    NORMALIZED_GRADE_INDEX,
+    grade_rank_sql,
+    normalize_grade,
+)
+from data.models import (
+    Student,
+    Class,
+    Enrollment,
+    Attendance,
+    add_audit_log,
+    add_audit_logs,
+    audit_diff,
+)
+from ui.background_task import BackgroundTask
 from ui.undo_manager import UndoManager
 from data.paths import STUDENT_PHOTOS_DIR 
 
 
+# Student fields captured in audit snapshots, in serialized order
+_STUDENT_AUDIT_FIELDS = (
+    "id",
+    "first_name",
+    "last_name",
+    "dob",
+    "grade_level",
+    "status",
+    "contact_email",
+    "guardian_name",
+    "guardian_phone",
+    "guardian_email",
+    "emergency_contact_name",
+    "emergency_contact_phone",
+    "notes",
+    "photo_path",
+)
+_student_audit_values = attrgetter(*_STUDENT_AUDIT_FIELDS)
+
+
 def student_to_dict(student: Student | None):
     """Convert a Student ORM object into a JSON-serializable dict for audit logs."""
     if student is None:
         return None
-    return {
-        "id": student.id,
-        "first_name": student.first_name,
-        "last_name": student.last_name,
-        "dob": student.dob.isoformat() if student.dob else None,
-        "grade_level": student.grade_level,
-        "status": student.status,
-        "contact_email": student.contact_email,
-        "guardian_name": student.guardian_name,
-        "guardian_phone": student.guardian_phone,
-        "guardian_email": student.guardian_email,
-        "emergency_contact_name": student.emergency_contact_name,
-        "emergency_contact_phone": student.emergency_contact_phone,
-        "notes": student.notes,
-        "photo_path": getattr(student, "photo_path", None),
-    }
+    data = dict(zip(_STUDENT_AUDIT_FIELDS, _student_audit_values(student)))
+    data["dob"] = data["dob"].isoformat() if data["dob"] else None
+    return data
+
+
+# Rows fetched per round-trip when loading the Students table
+STUDENT_BATCH_SIZE = 500
+
+
+def _text_column(column, expr=None):
+    """`column` (or `expr` built from it) as a non-NULL string, labelled with the column name."""
+    return func.coalesce(column if expr is None else expr, "").label(column.key)
+
+
+# Student columns shown in the table, in StudentsTableModel.HEADERS order.
+# Everything after the id comes back from SQLite as a display-ready string.
+STUDENT_TABLE_COLUMNS = (
+    Student.id,
+    _text_column(Student.first_name),
+    _text_column(Student.last_name),
+    _text_column(Student.dob, func.strftime("%Y-%m-%d", Student.dob)),
+    _text_column(Student.grade_level),
+    _text_column(Student.contact_email),
+    _text_column(Student.guardian_name),
+    _text_column(Student.guardian_phone),
+    _text_column(Student.guardian_email),
+    _text_column(Student.emergency_contact_name),
+    _text_column(Student.emergency_contact_phone),
+    _text_column(Student.status),
+)
+
+# Sort rank for Student.grade_level (see data.grades.grade_rank_sql)
+GRADE_SORT_RANK = grade_rank_sql(Student.grade_level)
+
+# Table order: grade, then last name, then id. Selected after the display
+# columns so the model can place a single changed row without a reload.
+STUDENT_SORT_COLUMNS = (GRADE_SORT_RANK, func.lower(Student.last_name))
+
+# Table rows for load_students (plain column tuples; no ORM objects needed),
+# in display order. Every student is loaded; the status filter and search
+# box are applied in memory by StudentsFilterProxy.
+ALL_STUDENTS_STMT = (
+    select(*STUDENT_TABLE_COLUMNS, *STUDENT_SORT_COLUMNS)
+    .order_by(*STUDENT_SORT_COLUMNS, Student.id)
+    .execution_options(yield_per=STUDENT_BATCH_SIZE)
+)
+STUDENT_ROW_STMT = ALL_STUDENTS_STMT.where(Student.id == bindparam("student_id"))
+
+
+class StudentsTableModel(QAbstractTableModel):
+    """
+    Read-only model behind the Students table.
+
+    Rows are stored column-wise (one list of display strings per column,
+    plus the integer ids) and cells are only looked up when the view asks
+    for them, instead of building a QTableWidgetItem per cell.
+    """
+
+    HEADERS = [
+        "ID",
+        "First Name",
+        "Last Name",
+        "DOB",
+        "Grade",
+        "Email",                 # student email
+        "Guardian Name",
+        "Guardian Phone",
+        "Guardian Email",
+        "Emergency Contact Name",
+        "Emergency Contact Phone",
+        "Status",
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids = []
+        self._columns = [[] for _ in self.HEADERS]
+        # Casefolded "first\0last" per row, matched by StudentsFilterProxy
+        self._search_keys = []
+        # (grade rank, lowercased last name, id) per row, in ascending order;
+        # used to place a single added/edited row without a full reload
+        self._sort_keys = []
+        # student id -> (raw row, display strings, search key, sort key);
+        # reused while the row's values are unchanged, e.g. across a reload
+        # after promoting students
+        self._row_cache: dict[int, tuple] = {}
+
+    def _format_row(self, row) -> tuple[str, ...]:
+        # Columns after the id are already strings (see STUDENT_TABLE_COLUMNS)
+        return (str(row[0]),) + row[1:len(self.HEADERS)]
+
+    def _entry(self, row) -> tuple:
+        """Cached (row, display, search key, sort key) for one query row."""
+        row = tuple(row)
+        student_id = row[0]
+        cached = self._row_cache.get(student_id)
+        if cached is None or cached[0] != row:
+            display = self._format_row(row)
+            search_key = f"{display[1].casefold()}\0{display[2].casefold()}"
+            # Trailing STUDENT_SORT_COLUMNS: grade rank, lower(last_name)
+            sort_key = (row[-2], row[-1], student_id)
+            cached = self._row_cache[student_id] = (row, display, search_key, sort_key)
+        return cached
+
+    def set_rows(self, rows) -> int:
+        """
+        Replace all rows and return how many there are. `rows` is any
+        iterable of ALL_STUDENTS_STMT rows (already in display order); it is
+        consumed once.
+        """
+        entry = self._entry
+        ids = []
+        add_id = ids.append
+        display_rows = []
+        add_display_row = display_rows.append
+        search_keys = []
+        add_search_key = search_keys.append
+        sort_keys = []
+        add_sort_key = sort_keys.append
+        for row in rows:
+            _row, display, search_key, sort_key = entry(row)
+            add_id(sort_key[2])
+            add_display_row(display)
+            add_search_key(search_key)
+            add_sort_key(sort_key)
+
+        self.beginResetModel()
+        self._ids = ids
+        self._search_keys = search_keys
+        self._sort_keys = sort_keys
+        if display_rows:
+            self._columns = [list(column) for column in zip(*display_rows)]
+        else:
+            self._columns = [[] for _ in self.HEADERS]
+        self.endResetModel()
+        return len(ids)
+
+    def put_row(self, row):
+        """
+        Insert or update a single student row (an ALL_STUDENTS_STMT row) at its
+        sorted position, emitting row-level signals instead of a reset.
+        """
+        _row, display, search_key, sort_key = self._entry(row)
+        student_id = sort_key[2]
+
+        if student_id in self._ids:
+            pos = self._ids.index(student_id)
+            keys = self._sort_keys
+            if (pos == 0 or keys[pos - 1] < sort_key) and (
+                pos == len(keys) - 1 or sort_key < keys[pos + 1]
+            ):
+                # Still sorts into the same place: refresh its cells
+                for column, value in zip(self._columns, display):
+                    column[pos] = value
+                self._search_keys[pos] = search_key
+                keys[pos] = sort_key
+                self.dataChanged.emit(
+                    self.index(pos, 0), self.index(pos, len(self.HEADERS) - 1)
+                )
+                return
+            self.remove_student(student_id, forget=False)
+
+        pos = bisect_left(self._sort_keys, sort_key)
+        self.beginInsertRows(QModelIndex(), pos, pos)
+        self._ids.insert(pos, student_id)
+        for column, value in zip(self._columns, display):
+            column.insert(pos, value)
+        self._search_keys.insert(pos, search_key)
+        self._sort_keys.insert(pos, sort_key)
+        self.endInsertRows()
+
+    def remove_student(self, student_id: int, forget: bool = True):
+        """Remove a student's row if shown; forget=True also drops its cache entry."""
+        if forget:
+            self._row_cache.pop(student_id, None)
+        if student_id not in self._ids:
+            return
+        pos = self._ids.index(student_id)
+        self.beginRemoveRows(QModelIndex(), pos, pos)
+        del self._ids[pos]
+        for column in self._columns:
+            del column[pos]
+        del self._search_keys[pos]
+        del self._sort_keys[pos]
+        self.endRemoveRows()
+
+    def student_id(self, row: int) -> int:
+        return self._ids[row]
+
+    def search_key(self, row: int) -> str:
+        return self._search_keys[row]
+
+    def status(self, row: int) -> str:
+        # Status is the last display column
+        return self._columns[-1][row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._columns[index.column()][index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+@lru_cache(maxsize=32)
+def _parse_search(text: str) -> tuple[str, int | None]:
+    """
+    Search box text -> (casefolded name needle, student ID). Digit-only
+    text is an ID search with an empty needle.
+    """
+    text = text.strip()
+    # isdecimal, not isdigit: int() rejects digit-like characters such as "²"
+    if text.isdecimal():
+        return "", int(text)
+    return text.casefold(), None
+
+
+class StudentsFilterProxy(QSortFilterProxyModel):
+    """
+    Applies the Students status filter and search box in memory: a row
+    matches when it has the chosen status and the text appears in the first
+    or last name (case-insensitive). Digit-only text is treated as a student
+    ID and matched against the ID alone.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._status = None  # None shows every status
+        self._needle = ""
+        self._search_id = None
+
+    def set_status(self, status: str):
+        self._status = None if status == "All" else status
+        self.invalidateFilter()
+
+    def set_search_text(self, text: str):
+        self._needle, self._search_id = _parse_search(text)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        if self._status is not None and model.status(source_row) != self._status:
+            return False
+        if self._search_id is not None:
+            return model.student_id(source_row) == self._search_id
+        if not self._needle:
+            return True
+        # Names are casefolded once per load (see StudentsTableModel.set_rows);
+        # the NUL separator stops a match spanning first and last name
+        return self._needle in model.search_key(source_row)
 
 
 class StudentsView(QWidget):
@@ -68,6 +362,8 @@ class StudentsView(QWidget):
         self.undo_manager = undo_manager          # <-- STORE IT
 
         # Build initial grade choices for Add/Edit dialog
+        # (start, graduating) grade range the cached grade_choices tuple was built for
+        self._grade_choices_range = None
         self.refresh_grade_choices()
 
         layout = QVBoxLayout()
@@ -96,26 +392,22 @@ class StudentsView(QWidget):
         layout.addLayout(filter_layout)
 
         # --- Students table ---
-        self.table = QTableWidget()
-        self.table.setColumnCount(12)
-        self.table.setHorizontalHeaderLabels(
-            [
-                "ID",
-                "First Name",
-                "Last Name",
-                "DOB",
-                "Grade",
-                "Email",                 # student email
-                "Guardian Name",
-                "Guardian Phone",
-                "Guardian Email",
-                "Emergency Contact Name",
-                "Emergency Contact Phone",
-                "Status",
-            ]
-        )
+        # Search filtering happens in the proxy; the DB is only re-queried
+        # when the status filter changes or students are modified.
+        self.model = StudentsTableModel(self)
+        self.proxy = StudentsFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         # Make cells read-only; use dialogs / widgets for edits
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Uniform row heights: no per-row height recalculation on reload
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # Columns are fitted to the data once (see load_students); after that
+        # the user's widths are kept instead of re-measuring every cell
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self._columns_sized = False
         layout.addWidget(self.table)
 
         self.setLayout(layout)
@@ -124,12 +416,19 @@ class StudentsView(QWidget):
         self.add_button.clicked.connect(self.add_student)
         self.delete_button.clicked.connect(self.delete_student)
 
-        # Search/filter actions
-        self.search_edit.textChanged.connect(self.load_students)
-        self.status_filter.currentTextChanged.connect(self.load_students)
+        # Search/filter actions. Typing is debounced so a burst of keystrokes
+        # (or a paste) re-filters the table once, 200 ms after the last one.
+        # Enter applies the pending search right away.
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self._apply_search)
+        self.search_edit.textChanged.connect(lambda _text: self._search_timer.start())
+        self.search_edit.returnPressed.connect(self._apply_search)
+        self.status_filter.currentTextChanged.connect(self.proxy.set_status)
 
         # Double-click → open profile (not raw edit dialog)
-        self.table.itemDoubleClicked.connect(self.open_student_profile)
+        self.table.doubleClicked.connect(self.open_student_profile)
 
         # Initial load
         self.load_students()
@@ -139,27 +438,11 @@ class StudentsView(QWidget):
     # ------------------------------------------------------------------
     def refresh_grade_choices(self):
         """
-        Rebuild the list of allowed grade choices from self.settings
+        Rebuild the tuple of allowed grade choices from self.settings
         (starting_grade → graduating_grade) on the canonical PreK–12 scale.
-        Called at startup and whenever Settings are changed.
+        Called at startup and whenever Settings are changed; a no-op when
+        the grade range is unchanged.
         """
-        canonical_scale = [
-            "PreK",
-            "K",
-            "1st",
-            "2nd",
-            "3rd",
-            "4th",
-            "5th",
-            "6th",
-            "7th",
-            "8th",
-            "9th",
-            "10th",
-            "11th",
-            "12th",
-        ]
-
         # Defaults if settings are missing
         start_name = "K"
         grad_name = "12th"
@@ -169,151 +452,68 @@ class StudentsView(QWidget):
             if getattr(self.settings, "graduating_grade", None):
                 grad_name = self.settings.graduating_grade
 
-        if start_name not in canonical_scale:
+        if start_name not in GRADE_SCALE:
             start_name = "K"
-        if grad_name not in canonical_scale:
+        if grad_name not in GRADE_SCALE:
             grad_name = "12th"
 
-        start_idx = canonical_scale.index(start_name)
-        grad_idx = canonical_scale.index(grad_name)
+        if (start_name, grad_name) == self._grade_choices_range:
+            return
+        self._grade_choices_range = (start_name, grad_name)
+
+        start_idx = GRADE_INDEX[start_name]
+        grad_idx = GRADE_INDEX[grad_name]
 
         if start_idx <= grad_idx:
-            self.grade_choices = canonical_scale[start_idx : grad_idx + 1]
+            self.grade_choices = GRADE_SCALE[start_idx : grad_idx + 1]
         else:
             # Fallback if Settings are somehow inverted
-            self.grade_choices = canonical_scale
+            self.grade_choices = GRADE_SCALE
 
     # ------------------------------------------------------------------
     # Load students from DB into the table
     # ------------------------------------------------------------------
     def load_students(self):
-        """Load students into the table, applying search + status filter."""
-        self.table.setRowCount(0)
-
-        # Get current filter values
-        search_text = ""
-        status_value = "All"
-
-        if hasattr(self, "search_edit"):
-            search_text = self.search_edit.text().strip()
-
-        if hasattr(self, "status_filter"):
-            status_value = self.status_filter.currentText()
-
-        # Build base query
-        query = self.session.query(Student)
-
-        # Status filter
-        if status_value != "All":
-            query = query.filter(Student.status == status_value)
-
-        # Search filter (by id or name)
-        if search_text:
-            # Try to parse numeric ID
-            try:
-                search_id = int(search_text)
-            except ValueError:
-                search_id = None
-
-            like_pattern = f"%{search_text}%"
-
-            filters = [
-                Student.first_name.ilike(like_pattern),
-                Student.last_name.ilike(like_pattern),
-            ]
-            if search_id is not None:
-                filters.append(Student.id == search_id)
-
-            query = query.filter(or_(*filters))
-
-        # Order by grade (PreK → 12), then last name, then id
-        students = query.all()
-
-        GRADE_ORDER = [
-            "PreK",
-            "K",
-            "1st",
-            "2nd",
-            "3rd",
-            "4th",
-            "5th",
-            "6th",
-            "7th",
-            "8th",
-            "9th",
-            "10th",
-            "11th",
-            "12th",
-        ]
-
-        def normalize_grade_text(s: str) -> str:
-            s = s.strip().lower()
-            if s in ("pre-k", "pre k", "prek", "prekindergarten"):
-                return "prek"
-            if s in ("k", "kindergarten"):
-                return "k"
-            s = s.replace("grade", "").strip()
-            s = s.replace(" ", "").replace("-", "")
-            return s
-
-        grade_rank_map = {}
-        for idx, g in enumerate(GRADE_ORDER):
-            grade_rank_map[normalize_grade_text(g)] = idx
-
-        def grade_rank(grade_level: str) -> int:
-            if not grade_level:
-                return len(GRADE_ORDER) + 1  # unknown grades at bottom
-
-            s = normalize_grade_text(grade_level)
-            if s in grade_rank_map:
-                return grade_rank_map[s]
-
-            # Fallback: try to parse number like "5", "5th", "5thgrade"
-            m = re.match(r"(\d+)", s)
-            if m:
-                n = int(m.group(1))
-                if 1 <= n <= 12:
-                    if n == 1:
-                        key = "1st"
-                    elif n == 2:
-                        key = "2nd"
-                    elif n == 3:
-                        key = "3rd"
-                    else:
-                        key = f"{n}th"
-                    return grade_rank_map.get(
-                        normalize_grade_text(key),
-                        len(GRADE_ORDER) + 1,
-                    )
-
-            return len(GRADE_ORDER) + 1
-
-        def student_sort_key(s):
-            return (
-                grade_rank(s.grade_level or ""),
-                (s.last_name or "").lower(),
-                s.id or 0,  # tie-breaker
-            )
-
-        students.sort(key=student_sort_key)
-
-        self.table.setRowCount(len(students))
-
-        for row, s in enumerate(students):
-            self.table.setItem(row, 0, QTableWidgetItem(str(s.id)))
-            self.table.setItem(row, 1, QTableWidgetItem(s.first_name or ""))
-            self.table.setItem(row, 2, QTableWidgetItem(s.last_name or ""))
-            self.table.setItem(row, 3, QTableWidgetItem(s.dob.isoformat() if s.dob else ""))
-            self.table.setItem(row, 4, QTableWidgetItem(s.grade_level or ""))
-            self.table.setItem(row, 5, QTableWidgetItem(s.contact_email or ""))
-            self.table.setItem(row, 6, QTableWidgetItem(s.guardian_name or ""))
-            self.table.setItem(row, 7, QTableWidgetItem(s.guardian_phone or ""))
-            self.table.setItem(row, 8, QTableWidgetItem(s.guardian_email or ""))
-            self.table.setItem(row, 9, QTableWidgetItem(s.emergency_contact_name or ""))
-            self.table.setItem(row, 10, QTableWidgetItem(s.emergency_contact_phone or ""))
-            self.table.setItem(row, 11, QTableWidgetItem(s.status or ""))
+        """
+        Load every student into the table. The status filter and search box
+        are applied on top by self.proxy, so changing them needs no query.
+        """
+        # Rows arrive already ordered by grade (PreK → 12), then last name,
+        # then id, and are streamed STUDENT_BATCH_SIZE at a time into the model
+        students = self.session.execute(ALL_STUDENTS_STMT)
+        self.model.set_rows(students)
+        self._fit_columns_once()
 
-        self.table.resizeColumnsToContents()
+    def refresh_student_row(self, student_id: int):
+        """
+        Re-read one student after an add/edit/delete (or its undo/redo) and
+        patch that row in the model, instead of reloading the whole table.
+        """
+        row = self.session.execute(
+            STUDENT_ROW_STMT, {"student_id": student_id}
+        ).first()
+        if row is None:
+            self.model.remove_student(student_id)
+        else:
+            self.model.put_row(row)
+        self._fit_columns_once()
+
+    def _fit_columns_once(self):
+        # Fit columns to the first non-empty load only
+        if self.model.rowCount() and not self._columns_sized:
+            self._columns_sized = True
+            QTimer.singleShot(0, self.table.resizeColumnsToContents)
+
+    def _apply_search(self):
+        self._search_timer.stop()
+        self.proxy.set_search_text(self.search_edit.text())
+
+    def _selected_student_id(self) -> int | None:
+        """ID of the student in the table's current row, or None."""
+        index = self.table.currentIndex()
+        if not index.isValid():
+            return None
+        return self.model.student_id(self.proxy.mapToSource(index).row())
 
     # ------------------------------------------------------------------
     # Add a new student
@@ -374,30 +574,20 @@ class StudentsView(QWidget):
             )
 
             self.session.commit()
-            self.load_students()
+            self.refresh_student_row(s.id)
 
     # ------------------------------------------------------------------
     # Delete selected student (UNDOABLE)
     # ------------------------------------------------------------------
     def delete_student(self):
         """Delete the currently selected student from the table and DB (undoable)."""
-        row = self.table.currentRow()
-        if row < 0:
+        student_id = self._selected_student_id()
+        if student_id is None:
             QMessageBox.warning(
                 self, "Delete Student", "Please select a student to delete."
             )
             return
 
-        # ID is in column 0
-        id_item = self.table.item(row, 0)
-        if id_item is None:
-            QMessageBox.warning(
-                self, "Delete Student", "Could not determine student ID."
-            )
-            return
-
-        student_id = int(id_item.text())
-
         # Confirm with the user
         reply = QMessageBox.question(
             self,
@@ -433,61 +623,46 @@ class StudentsView(QWidget):
             "notes": student.notes,
             "photo_path": getattr(student, "photo_path", None),
         }
+        # Audit form of the same snapshot: the "before" of every delete and
+        # the "after" of every restore, serialized once for all undo/redo
+        audit_snapshot = student_to_dict(student)
 
         def redo_delete():
+            # Identity-map hit: the student is loaded (or was just restored)
             obj = self.session.get(Student, snapshot["id"])
             if obj is None:
                 return
-            before = student_to_dict(obj)
             add_audit_log(
                 self.session,
                 actor="System",
                 action="delete",
                 entity="Student",
                 entity_id=obj.id,
-                before=before,
+                before=audit_snapshot,
                 after=None,
             )
             self.session.delete(obj)
             self.session.commit()
-            self.load_students()
+            self.refresh_student_row(snapshot["id"])
 
         def undo_delete():
             existing = self.session.get(Student, snapshot["id"])
             if existing is not None:
                 return
 
-            restored = Student(
-                id=snapshot["id"],
-                first_name=snapshot["first_name"],
-                last_name=snapshot["last_name"],
-                dob=snapshot["dob"],
-                grade_level=snapshot["grade_level"],
-                status=snapshot["status"],
-                contact_email=snapshot["contact_email"],
-                guardian_name=snapshot["guardian_name"],
-                guardian_phone=snapshot["guardian_phone"],
-                guardian_email=snapshot["guardian_email"],
-                emergency_contact_name=snapshot["emergency_contact_name"],
-                emergency_contact_phone=snapshot["emergency_contact_phone"],
-                notes=snapshot["notes"],
-            )
-            if snapshot["photo_path"] is not None:
-                restored.photo_path = snapshot["photo_path"]
-
-            self.session.add(restored)
-            after = student_to_dict(restored)
+            # The snapshot holds every column, so it rebuilds the row as-is
+            self.session.add(Student(**snapshot))
             add_audit_log(
                 self.session,
                 actor="System",
                 action="create",
                 entity="Student",
-                entity_id=restored.id,
+                entity_id=snapshot["id"],
                 before=None,
-                after=after,
+                after=audit_snapshot,
             )
             self.session.commit()
-            self.load_students()
+            self.refresh_student_row(snapshot["id"])
 
         # Perform the delete now
         redo_delete()
@@ -505,27 +680,14 @@ class StudentsView(QWidget):
     # ------------------------------------------------------------------
     def open_student_profile(self, item=None):
         """Open profile dialog for the selected student."""
-        row = self.table.currentRow()
-        if row < 0:
+        student_id = self._selected_student_id()
+        if student_id is None:
             QMessageBox.warning(
                 self, "Student Profile", "Please select a student first."
             )
             return
 
-        id_item = self.table.item(row, 0)
-        if id_item is None:
-            QMessageBox.warning(
-                self, "Student Profile", "Could not determine student ID."
-            )
-            return
-
-        student_id = int(id_item.text())
-
-        student = (
-            self.session.query(Student)
-            .filter(Student.id == student_id)
-            .first()
-        )
+        student = self.session.get(Student, student_id)
         if student is None:
             QMessageBox.warning(
                 self, "Student Profile", "Student not found in database."
@@ -540,11 +702,8 @@ class StudentsView(QWidget):
     # ------------------------------------------------------------------
     def edit_selected_student_by_id(self, student_id: int):
         """Open edit dialog for a given student id (undoable)."""
-        student = (
-            self.session.query(Student)
-            .filter(Student.id == student_id)
-            .first()
-        )
+        # Identity-map lookup: no SELECT if the student is already loaded
+        student = self.session.get(Student, student_id)
 
         if student is None:
             QMessageBox.warning(self, "Edit Student", "Student not found in database.")
@@ -626,19 +785,20 @@ class StudentsView(QWidget):
 
         after_snapshot = student_to_dict(student)
 
-        # Audit log for the edit
+        # Audit log for the edit (changed fields only)
+        before_changes, after_changes = audit_diff(before_snapshot, after_snapshot)
         add_audit_log(
             self.session,
             actor="System",
             action="update",
             entity="Student",
             entity_id=student.id,
-            before=before_snapshot,
-            after=after_snapshot,
+            before=before_changes,
+            after=after_changes,
         )
 
         self.session.commit()
-        self.load_students()
+        self.refresh_student_row(student.id)
 
         # Register undo/redo
         if self.undo_manager is not None:
@@ -661,7 +821,7 @@ class StudentsView(QWidget):
                 obj.emergency_contact_name = old_data["emergency_contact_name"]
                 obj.emergency_contact_phone = old_data["emergency_contact_phone"]
                 obj.notes = old_data["notes"]
-                after = student_to_dict(obj)
+                before, after = audit_diff(before, student_to_dict(obj))
                 add_audit_log(
                     self.session,
                     actor="System",
@@ -672,7 +832,7 @@ class StudentsView(QWidget):
                     after=after,
                 )
                 self.session.commit()
-                self.load_students()
+                self.refresh_student_row(sid)
 
             def redo_edit():
                 obj = self.session.get(Student, sid)
@@ -691,7 +851,7 @@ class StudentsView(QWidget):
                 obj.emergency_contact_name = new_data["emergency_contact_name"]
                 obj.emergency_contact_phone = new_data["emergency_contact_phone"]
                 obj.notes = new_data["notes"]
-                after = student_to_dict(obj)
+                before, after = audit_diff(before, student_to_dict(obj))
                 add_audit_log(
                     self.session,
                     actor="System",
@@ -702,7 +862,7 @@ class StudentsView(QWidget):
                     after=after,
                 )
                 self.session.commit()
-                self.load_students()
+                self.refresh_student_row(sid)
 
             self.undo_manager.push(
                 undo_edit,
@@ -724,77 +884,23 @@ class StudentsView(QWidget):
         if not grade_level:
             return None, False
 
-        # Canonical PreK–12 scale
-        canonical_scale = [
-            "PreK",
-            "K",
-            "1st",
-            "2nd",
-            "3rd",
-            "4th",
-            "5th",
-            "6th",
-            "7th",
-            "8th",
-            "9th",
-            "10th",
-            "11th",
-            "12th",
-        ]
-
-        def normalize(s: str) -> str:
-            """Normalize a grade string for comparison."""
-            s = s.strip().lower()
-            # common synonyms
-            if s in ("pre-k", "pre k", "prek", "prekindergarten"):
-                return "prek"
-            if s in ("k", "kindergarten"):
-                return "k"
-            # remove words like 'grade'
-            s = s.replace("grade", "").strip()
-            # remove spaces and hyphens
-            s = s.replace(" ", "").replace("-", "")
-            return s
-
-        # Build mapping from normalized text to canonical index
-        norm_to_index = {}
-        for idx, g in enumerate(canonical_scale):
-            n = normalize(g)
-            norm_to_index[n] = idx
-
-        # Determine the allowed range from settings, defaulting to K–12th
-        start_name = "K"
+        # Graduating grade from settings, defaulting to 12th (only the top of
+        # the range matters here; the starting grade limits the choices only)
         grad_name = "12th"
-        if getattr(self, "settings", None) is not None:
-            if self.settings.starting_grade:
-                start_name = self.settings.starting_grade
-            if self.settings.graduating_grade:
-                grad_name = self.settings.graduating_grade
-
-        # Ensure they exist in the canonical list
-        if start_name not in canonical_scale:
-            start_name = "K"
-        if grad_name not in canonical_scale:
+        if getattr(self, "settings", None) is not None and self.settings.graduating_grade:
+            grad_name = self.settings.graduating_grade
+        grad_idx = GRADE_INDEX.get(grad_name)
+        if grad_idx is None:
             grad_name = "12th"
+            grad_idx = GRADE_INDEX[grad_name]
 
-        start_idx = canonical_scale.index(start_name)
-        grad_idx = canonical_scale.index(grad_name)
-
-        # Try to match the student's grade_level against canonical list
-        norm_grade = normalize(grade_level)
-        if norm_grade in norm_to_index:
-            idx = norm_to_index[norm_grade]
-
+        # Try to match the student's grade_level against canonical list.
+        # Below the graduating grade the next grade always exists on the scale.
+        idx = NORMALIZED_GRADE_INDEX.get(normalize_grade(grade_level))
+        if idx is not None:
             if idx >= grad_idx:
                 return grade_level, True
-
-            new_idx = idx + 1
-            new_idx = min(new_idx, len(canonical_scale) - 1)
-            new_grade = canonical_scale[new_idx]
-            if new_idx > grad_idx:
-                return grade_level, True
-
-            return new_grade, False
+            return GRADE_SCALE[idx + 1], False
 
         # Fallback: numeric heuristic
         s = grade_level.strip().lower()
@@ -802,14 +908,14 @@ class StudentsView(QWidget):
         if s in ("k", "kindergarten"):
             return "1st", False
 
-        m = re.match(r"(\d+)", s)
+        m = GRADE_DIGIT_RE.match(s)
         if not m:
             return None, False
 
         n = int(m.group(1))
 
         grad_num = 12
-        m_grad = re.match(r"(\d+)", grad_name.lower())
+        m_grad = GRADE_DIGIT_RE.match(grad_name.lower())
         if m_grad:
             grad_num = int(m_grad.group(1))
 
@@ -842,46 +948,82 @@ class StudentsView(QWidget):
         NOTE: Any confirmation or admin password checks should be done
         by the caller (e.g. SettingsView) before calling this method.
         """
-        # Query all Active students
-        active_students = (
-            self.session.query(Student)
-            .filter(Student.status == "Active")
-            .all()
-        )
+        # Work out each distinct grade's transition once (a handful of values)
+        active = Student.status == "Active"
+        transitions = {
+            grade: self._promote_grade_level(grade)
+            for grade in self.session.execute(
+                select(Student.grade_level).where(active).distinct()
+            ).scalars()
+        }
+
+        # Each promotion changes a single field, so the audit rows only need
+        # the id and current grade (status is always "Active" here)
+        active_rows = self.session.execute(
+            select(Student.id, Student.grade_level).where(active).order_by(Student.id)
+        ).all()
 
         promoted_count = 0
         graduated_count = 0
         skipped_count = 0
+        audit_entries = []
 
-        for student in active_students:
-            before = student_to_dict(student)
-
-            new_grade, became_graduate = self._promote_grade_level(student.grade_level)
+        for student_id, grade_level in active_rows:
+            new_grade, became_graduate = transitions[grade_level]
 
             if new_grade is None and not became_graduate:
                 skipped_count += 1
                 continue
 
             if became_graduate:
-                student.status = "Graduated"
+                before, after = {"status": "Active"}, {"status": "Graduated"}
                 graduated_count += 1
-
-            if new_grade is not None and not became_graduate:
-                student.grade_level = new_grade
+            else:
+                before, after = audit_diff(
+                    {"grade_level": grade_level}, {"grade_level": new_grade}
+                )
                 promoted_count += 1
 
-            after = student_to_dict(student)
             if before != after:
-                add_audit_log(
-                    self.session,
-                    actor="System",
-                    action="update",
-                    entity="Student",
-                    entity_id=student.id,
-                    before=before,
-                    after=after,
+                audit_entries.append(
+                    {
+                        "actor": "System",
+                        "action": "update",
+                        "entity": "Student",
+                        "entity_id": student_id,
+                        "before": before,
+                        "after": after,
+                    }
                 )
 
+        # One INSERT for all audit rows
+        add_audit_logs(self.session, audit_entries)
+
+        # Two set-based UPDATEs. Graduate first, so students promoted into the
+        # graduating grade below are not graduated in the same run.
+        graduating = [g for g, (_new, grad) in transitions.items() if grad]
+        if graduating:
+            self.session.execute(
+                update(Student)
+                .where(active, Student.grade_level.in_(graduating))
+                .values(status="Graduated"),
+                execution_options={"synchronize_session": "fetch"},
+            )
+        promotions = {
+            g: new
+            for g, (new, grad) in transitions.items()
+            if new is not None and not grad and new != g
+        }
+        if promotions:
+            self.session.execute(
+                update(Student)
+                .where(active, Student.grade_level.in_(promotions))
+                .values(
+                    grade_level=case(promotions, value=Student.grade_level)
+                ),
+                execution_options={"synchronize_session": "fetch"},
+            )
+
         self.session.commit()
 
         if hasattr(self, "load_students"):
@@ -911,25 +1053,11 @@ class AddStudentDialog(QDialog):
         self._student = student
 
         # Grade options for the combo box (from StudentsView)
+        # Shared tuple from StudentsView; read-only here, so no copy
         if grade_choices is not None and len(grade_choices) > 0:
-            self._grade_choices = list(grade_choices)
+            self._grade_choices = grade_choices
         else:
-            self._grade_choices = [
-                "PreK",
-                "K",
-                "1st",
-                "2nd",
-                "3rd",
-                "4th",
-                "5th",
-                "6th",
-                "7th",
-                "8th",
-                "9th",
-                "10th",
-                "11th",
-                "12th",
-            ]
+            self._grade_choices = GRADE_SCALE
 
         self.setWindowTitle("Edit Student" if student else "Add Student")
 
@@ -1087,6 +1215,119 @@ class AddStudentDialog(QDialog):
         )
 
 
+# Attendance rows fetched per page in the profile dialog ("Load More" adds
+# the next page)
+PROFILE_ATTENDANCE_PAGE_SIZE = 500
+
+# Profile dialog queries, built once; the attendance one re-runs on every
+# range change or page with only its bound parameters changing. Both select just
+# the displayed columns, already as strings in table column order.
+PROFILE_ENROLLMENTS_STMT = (
+    select(
+        _text_column(Class.name),
+        _text_column(Class.subject),
+        _text_column(Class.term),
+        _text_column(
+            Enrollment.start_date, func.strftime("%Y-%m-%d", Enrollment.start_date)
+        ),
+        _text_column(
+            Enrollment.end_date, func.strftime("%Y-%m-%d", Enrollment.end_date)
+        ),
+    )
+    .join(Class, Enrollment.class_id == Class.id)
+    .where(Enrollment.student_id == bindparam("student_id"))
+)
+PROFILE_ATTENDANCE_STMT = (
+    select(
+        _text_column(Attendance.date, func.strftime("%Y-%m-%d", Attendance.date)),
+        _text_column(Class.name),
+        _text_column(Class.term),
+        _text_column(Attendance.status),
+    )
+    .join(Class, Attendance.class_id == Class.id)
+    .where(
+        Attendance.student_id == bindparam("student_id"),
+        Attendance.date >= bindparam("start"),
+        Attendance.date <= bindparam("end"),
+    )
+    # Newest first; id keeps the order stable across pages on the same day
+    .order_by(Attendance.date.desc(), Attendance.id.desc())
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+)
+# (first enrollment start, first attendance date) for one student, as two
+# MIN() aggregates in a single round-trip
+PROFILE_FIRST_DATES_STMT = select(
+    select(func.min(Enrollment.start_date))
+    .where(Enrollment.student_id == bindparam("student_id"))
+    .scalar_subquery(),
+    select(func.min(Attendance.date))
+    .where(Attendance.student_id == bindparam("student_id"))
+    .scalar_subquery(),
+)
+
+
+# Scaled profile photos, most recently used last:
+# (path, mtime_ns, width, height) -> QPixmap. GUI thread only.
+PHOTO_CACHE_SIZE = 32
+_photo_cache: OrderedDict[tuple, QPixmap] = OrderedDict()
+
+# Photo decodes still running. BackgroundTask doesn't auto-delete, so this
+# keeps each task (and its signals) alive until it reports back, even if
+# its dialog has moved on to another photo or been closed.
+_photo_tasks: set[BackgroundTask] = set()
+
+
+def _forget_photo_task(task, _result):
+    _photo_tasks.discard(task)
+
+
+def _scaled_photo(path: str, width: int, height: int) -> QImage | None:
+    """
+    Decode and scale a photo for the profile header. Runs on the thread
+    pool, so it works on a QImage (QPixmap is GUI-thread only).
+    """
+    image = QImage(path)
+    if image.isNull():
+        return None
+    return image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def _fill_table(table: QTableWidget, rows, fit_columns: bool = True):
+    """
+    Refill a QTableWidget from rows of display strings, optionally fitting
+    columns afterwards. Items left from the previous fill are reused (only
+    their text changes), and repaints and per-cell model signals are held
+    off until every item is set, then the view is told once.
+    """
+    model = table.model()
+    table.setUpdatesEnabled(False)
+    try:
+        # Size the table once; rows past the new count drop their items
+        table.setRowCount(len(rows))
+        with QSignalBlocker(model):
+            item_at = table.item
+            set_item = table.setItem
+            for row, values in enumerate(rows):
+                for col, text in enumerate(values):
+                    item = item_at(row, col)
+                    if item is None:
+                        set_item(row, col, QTableWidgetItem(text))
+                    else:
+                        item.setText(text)
+        if rows:
+            # One range update for the view; the table's itemChanged stays quiet
+            with QSignalBlocker(table):
+                model.dataChanged.emit(
+                    model.index(0, 0),
+                    model.index(len(rows) - 1, table.columnCount() - 1),
+                )
+    finally:
+        table.setUpdatesEnabled(True)
+    if fit_columns:
+        table.resizeColumnsToContents()
+
+
 # ----------------------------------------------------------------------
 # StudentProfileDialog (now logs notes/photo updates)
 # ----------------------------------------------------------------------
@@ -1106,6 +1347,13 @@ class StudentProfileDialog(QDialog):
         self.session = session
         self.student = student
         self.parent_view = parent_view
+        # Tables whose columns have been fitted (see _fill)
+        self._fitted_tables = set()
+        # Bumped per _load_photo; decodes from an earlier call are not shown
+        self._photo_generation = 0
+        # Attendance range shown and the rows loaded for it so far
+        self._attendance_range = None
+        self._attendance_rows = []
 
         self.setWindowTitle(
             f"Student Profile - {student.first_name} {student.last_name}"
@@ -1118,6 +1366,18 @@ class StudentProfileDialog(QDialog):
         self.resize(1200, 650)
 
         self._build_ui()
+        # Enrollment and attendance are queried once the dialog is showing
+        # (see showEvent), so opening a profile doesn't wait on them
+        self._panes_loaded = False
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._panes_loaded:
+            self._panes_loaded = True
+            # Next event-loop turn: the header and photo paint first
+            QTimer.singleShot(0, self._load_panes)
+
+    def _load_panes(self):
         self._load_enrollments()
         self._init_attendance_range()
         self._reload_attendance_table()
@@ -1232,6 +1492,8 @@ class StudentProfileDialog(QDialog):
             ["Class", "Subject", "Term", "Start Date", "End Date"]
         )
         self.enrollment_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # Uniform row heights: no per-row size-hint queries on refill
+        self.enrollment_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         enroll_layout.addWidget(self.enrollment_table)
 
         enroll_group.setLayout(enroll_layout)
@@ -1262,8 +1524,14 @@ class StudentProfileDialog(QDialog):
             ["Date", "Class", "Term", "Status"]
         )
         self.attendance_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.attendance_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         attendance_layout.addWidget(self.attendance_table)
 
+        # Long histories are loaded a page at a time
+        self.load_more_attendance_button = QPushButton("Load More")
+        self.load_more_attendance_button.setVisible(False)
+        attendance_layout.addWidget(self.load_more_attendance_button)
+
         attendance_group.setLayout(attendance_layout)
         # Let the attendance group take all vertical space in right pane
         right_pane.addWidget(attendance_group, 1)
@@ -1295,12 +1563,13 @@ class StudentProfileDialog(QDialog):
         self.save_notes_button.clicked.connect(self.save_notes)
         self.change_photo_button.clicked.connect(self.change_photo)
         self.edit_button.clicked.connect(self.edit_student)
-        self.enrollment_term_filter.currentTextChanged.connect(
+        self.enrollment_term_filter.currentIndexChanged.connect(
             self._update_enrollment_table_from_filter
         )
-        self.attendance_range_combo.currentTextChanged.connect(
-            lambda _: self._reload_attendance_table()
+        self.attendance_range_combo.currentIndexChanged.connect(
+            self._reload_attendance_table
         )
+        self.load_more_attendance_button.clicked.connect(self._load_more_attendance)
 
         # Fill initial data
         self._refresh_header_and_notes()
@@ -1344,26 +1613,53 @@ class StudentProfileDialog(QDialog):
     def _load_photo(self):
         self.photo_label.setPixmap(QPixmap())
         self.photo_label.setText("No Photo")
+        # A decode still running for an earlier photo is ignored when it ends
+        self._photo_generation += 1
 
         path_str = self.student.photo_path
         if not path_str:
             return
 
-        path = Path(path_str)
-        if not path.is_file():
+        try:
+            mtime = Path(path_str).stat().st_mtime_ns
+        except OSError:
             return
 
-        pix = QPixmap(str(path))
-        if pix.isNull():
+        width = self.photo_label.width()
+        height = self.photo_label.height()
+        key = (path_str, mtime, width, height)
+        cached = _photo_cache.get(key)
+        if cached is not None:
+            _photo_cache.move_to_end(key)
+            self._show_photo(cached)
             return
 
-        scaled = pix.scaled(
-            self.photo_label.width(),
-            self.photo_label.height(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation,
-        )
-        self.photo_label.setPixmap(scaled)
+        # Decode off the GUI thread; the result arrives in _on_photo_loaded
+        task = BackgroundTask(lambda: _scaled_photo(path_str, width, height))
+        task.photo_key = key
+        task.photo_generation = self._photo_generation
+        # Success or failure, the task is released once it reports back;
+        # a failed decode just leaves "No Photo"
+        task.signals.finished.connect(_forget_photo_task)
+        task.signals.failed.connect(_forget_photo_task)
+        task.signals.finished.connect(self._on_photo_loaded)
+        _photo_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_photo_loaded(self, task, image: QImage | None):
+        if image is None:
+            return  # unreadable image: keep "No Photo"
+
+        # Cached even when stale: the key still names this exact file
+        pix = QPixmap.fromImage(image)
+        _photo_cache[task.photo_key] = pix
+        if len(_photo_cache) > PHOTO_CACHE_SIZE:
+            _photo_cache.popitem(last=False)
+        if task.photo_generation == self._photo_generation:
+            self._show_photo(pix)
+
+    def _show_photo(self, pix: QPixmap):
+        self.photo_label.setPixmap(pix)
         self.photo_label.setText("")
 
     def change_photo(self):
@@ -1419,9 +1715,11 @@ class StudentProfileDialog(QDialog):
             )
             return
 
-        before = student_to_dict(student)
+        # Only photo_path changes, so only it goes into the audit row
+        before, after = audit_diff(
+            {"photo_path": student.photo_path}, {"photo_path": str(dest_path)}
+        )
         student.photo_path = str(dest_path)
-        after = student_to_dict(student)
 
         add_audit_log(
             self.session,
@@ -1457,9 +1755,9 @@ class StudentProfileDialog(QDialog):
             )
             return
 
-        before = student_to_dict(student)
+        # Only notes change, so only they go into the audit row
+        before, after = audit_diff({"notes": student.notes}, {"notes": text})
         student.notes = text
-        after = student_to_dict(student)
 
         add_audit_log(
             self.session,
@@ -1486,58 +1784,33 @@ class StudentProfileDialog(QDialog):
         """
         Load all enrollment rows and populate the term filter + table.
         """
-        self._enrollment_rows = []
-
-        records = (
-            self.session.query(Enrollment, Class)
-            .join(Class, Enrollment.class_id == Class.id)
-            .filter(Enrollment.student_id == self.student.id)
-            .all()
-        )
-
-        terms = set()
-        for e, c in records:
-            term = c.term or ""
-            if term:
-                terms.add(term)
-            self._enrollment_rows.append(
-                {
-                    "class_name": c.name or "",
-                    "subject": c.subject or "",
-                    "term": term,
-                    "start_date": e.start_date,
-                    "end_date": e.end_date,
-                }
+        # (name, subject, term, start, end) display strings, kept for the
+        # term filter so changing terms needs no query
+        self._enrollment_rows = [
+            tuple(row)
+            for row in self.session.execute(
+                PROFILE_ENROLLMENTS_STMT, {"student_id": self.student.id}
             )
+        ]
+        terms = {row[2] for row in self._enrollment_rows}
 
         # Build term filter
-        self.enrollment_term_filter.blockSignals(True)
-        self.enrollment_term_filter.clear()
-        self.enrollment_term_filter.addItem("All terms")
-        for term in sorted(t for t in terms if t):
-            self.enrollment_term_filter.addItem(term)
-        self.enrollment_term_filter.blockSignals(False)
+        with QSignalBlocker(self.enrollment_term_filter):
+            self.enrollment_term_filter.clear()
+            self.enrollment_term_filter.addItem("All terms")
+            for term in sorted(t for t in terms if t):
+                self.enrollment_term_filter.addItem(term)
 
         self._update_enrollment_table_from_filter()
 
     def _update_enrollment_table_from_filter(self):
         selected_term = self.enrollment_term_filter.currentText()
-        rows = []
-        for r in self._enrollment_rows:
-            if selected_term == "All terms" or r["term"] == selected_term:
-                rows.append(r)
-
-        self.enrollment_table.setRowCount(len(rows))
-        for row, r in enumerate(rows):
-            self.enrollment_table.setItem(row, 0, QTableWidgetItem(r["class_name"]))
-            self.enrollment_table.setItem(row, 1, QTableWidgetItem(r["subject"]))
-            self.enrollment_table.setItem(row, 2, QTableWidgetItem(r["term"]))
-            start_text = r["start_date"].isoformat() if r["start_date"] else ""
-            end_text = r["end_date"].isoformat() if r["end_date"] else ""
-            self.enrollment_table.setItem(row, 3, QTableWidgetItem(start_text))
-            self.enrollment_table.setItem(row, 4, QTableWidgetItem(end_text))
-
-        self.enrollment_table.resizeColumnsToContents()
+        rows = [
+            r
+            for r in self._enrollment_rows
+            if selected_term == "All terms" or r[2] == selected_term
+        ]
+        self._fill(self.enrollment_table, rows)
 
     # ------------------------------------------------------------------
     # Attendance history
@@ -1547,40 +1820,21 @@ class StudentProfileDialog(QDialog):
         Determine earliest relevant date (first enrollment start_date or first attendance)
         and initialize the range presets.
         """
-        # Earliest enrollment start_date
-        enroll_dates = [
-            e.start_date
-            for e in self.session.query(Enrollment)
-            .filter(
-                Enrollment.student_id == self.student.id,
-                Enrollment.start_date.isnot(None),
-            )
-            .all()
-            if e.start_date is not None
-        ]
-
-        earliest_enroll = min(enroll_dates) if enroll_dates else None
-
-        # Earliest attendance
-        first_att = (
-            self.session.query(Attendance)
-            .filter(Attendance.student_id == self.student.id)
-            .order_by(Attendance.date)
-            .first()
-        )
-        earliest_att = first_att.date if first_att is not None else None
+        # Earliest enrollment start_date and earliest attendance
+        earliest_enroll, earliest_att = self.session.execute(
+            PROFILE_FIRST_DATES_STMT, {"student_id": self.student.id}
+        ).one()
 
         candidates = [d for d in [earliest_enroll, earliest_att] if d is not None]
         self.first_relevant_date = min(candidates) if candidates else None
         self.today = date.today()
 
-        self.attendance_range_combo.blockSignals(True)
-        self.attendance_range_combo.clear()
-        self.attendance_range_combo.addItem("Last 30 days")
-        self.attendance_range_combo.addItem("Last 60 days")
-        if self.first_relevant_date is not None:
-            self.attendance_range_combo.addItem("From first enrollment to today")
-        self.attendance_range_combo.blockSignals(False)
+        with QSignalBlocker(self.attendance_range_combo):
+            self.attendance_range_combo.clear()
+            self.attendance_range_combo.addItem("Last 30 days")
+            self.attendance_range_combo.addItem("Last 60 days")
+            if self.first_relevant_date is not None:
+                self.attendance_range_combo.addItem("From first enrollment to today")
 
         # Default: Last 30 days
         self.attendance_range_combo.setCurrentIndex(0)
@@ -1603,46 +1857,55 @@ class StudentProfileDialog(QDialog):
         return start, end
 
     def _reload_attendance_table(self):
-        start, end = self._compute_attendance_range()
-
-        records = (
-            self.session.query(Attendance, Class)
-            .join(Class, Attendance.class_id == Class.id)
-            .filter(
-                Attendance.student_id == self.student.id,
-                Attendance.date >= start,
-                Attendance.date <= end,
-            )
-            .order_by(Attendance.date.desc())
-            .all()
-        )
-
-        self.attendance_table.setRowCount(len(records))
-        for row, (a, c) in enumerate(records):
-            date_text = a.date.isoformat() if a.date else ""
-            class_name = c.name or ""
-            term = c.term or ""
-            status = a.status or ""
-
-            self.attendance_table.setItem(row, 0, QTableWidgetItem(date_text))
-            self.attendance_table.setItem(row, 1, QTableWidgetItem(class_name))
-            self.attendance_table.setItem(row, 2, QTableWidgetItem(term))
-            self.attendance_table.setItem(row, 3, QTableWidgetItem(status))
-
-        self.attendance_table.resizeColumnsToContents()
+        attendance_range = self._compute_attendance_range()
+        # Presets clamp to first_relevant_date, so for a recent student they
+        # often give the same dates as the range already shown
+        if attendance_range == self._attendance_range:
+            return
+        self._attendance_range = attendance_range
+        self._attendance_rows = []
+        self._load_more_attendance()
+
+    def _load_more_attendance(self):
+        """Append the next page of attendance for the current range."""
+        start, end = self._attendance_range
+        # (date, class, term, status) display strings; one extra row tells
+        # whether another page exists
+        page = self.session.execute(
+            PROFILE_ATTENDANCE_STMT,
+            {
+                "student_id": self.student.id,
+                "start": start,
+                "end": end,
+                "limit": PROFILE_ATTENDANCE_PAGE_SIZE + 1,
+                "offset": len(self._attendance_rows),
+            },
+        ).all()
+        has_more = len(page) > PROFILE_ATTENDANCE_PAGE_SIZE
+        self._attendance_rows.extend(page[:PROFILE_ATTENDANCE_PAGE_SIZE])
+        # Rows already shown keep their items (see _fill_table)
+        self._fill(self.attendance_table, self._attendance_rows)
+        self.load_more_attendance_button.setVisible(has_more)
+
+    def _fill(self, table: QTableWidget, rows):
+        # Fit columns on the first non-empty fill only; filter/range changes
+        # keep the widths instead of re-measuring every cell
+        fit = bool(rows) and table not in self._fitted_tables
+        _fill_table(table, rows, fit_columns=fit)
+        if fit:
+            self._fitted_tables.add(table)
 
     # ------------------------------------------------------------------
     # Edit student from profile
     # ------------------------------------------------------------------
     def edit_student(self):
         self.parent_view.edit_selected_student_by_id(self.student.id)
-        # Reload the student from DB to reflect updates
+        # Identity-map lookup; the edit was committed on this same session
         student = self.session.get(Student, self.student.id)
         if student is None:
             self.reject()
             return
         self.student = student
+        # The edit dialog only changes the student's own fields (not the
+        # photo, enrollments or attendance), so only the header/notes refresh
         self._refresh_header_and_notes()
-        self._load_photo()
-        self._load_enrollments()
-        self._reload_attendance_table()
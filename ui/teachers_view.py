@@ -363,11 +363,7 @@ class TeachersView(QWidget):
             return
 
         teacher_id = int(id_item.text())
-        teacher = (
-            self.session.query(Teacher)
-            .filter(Teacher.id == teacher_id)
-            .first()
-        )
+        teacher = self.session.get(Teacher, teacher_id)
         if teacher is None:
             QMessageBox.warning(self, "Teacher Profile", "Teacher not found in database.")
             return